@@ -0,0 +1,306 @@
+"""
+Batch conversion of several Spotify playlists at once.
+
+All playlists share one Spotify client and one YouTube Music client. Tracks
+that appear in more than one playlist are searched on YouTube Music only once
+and the match is fanned back out to every playlist containing it.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import pandas as pd
+
+from services.spotify import PAGE_SIZE, SpotifyService
+from services.youtube import DEFAULT_SEARCH_WORKERS, YouTubeMusicService
+from utils.dataframes import compact_dataframe
+from utils.io import read_manifest, write_json
+from utils.text import normalize_key
+
+
+def search_keys(spotify_df: pd.DataFrame) -> pd.Series:
+    """
+    Build the deduplication key used to search each track only once.
+    
+    The YouTube Music query depends only on artist and title, so tracks
+    sharing both after normalization (even under different Spotify IDs)
+    share a search.
+    
+    Args:
+        spotify_df: DataFrame with Spotify track data
+        
+    Returns:
+        Series of keys aligned with spotify_df
+    """
+    return (
+        spotify_df['artist_name'].astype(str).map(normalize_key)
+        + '\x1f'
+        + spotify_df['track_name'].astype(str).map(normalize_key)
+    )
+
+
+class BatchConversionService:
+    """Service class for converting many Spotify playlists in one pass."""
+    
+    def __init__(self,
+                 spotify_service: Optional[SpotifyService] = None,
+                 youtube_service: Optional[YouTubeMusicService] = None):
+        """
+        Initialize the batch service with shared clients.
+        
+        Args:
+            spotify_service: Spotify service shared by all playlists (created if None)
+            youtube_service: YouTube Music service shared by all playlists (created if None)
+        """
+        self.spotify_service = spotify_service or SpotifyService()
+        self.youtube_service = youtube_service or YouTubeMusicService()
+    
+    def load_playlist(self, playlist_url: str) -> Dict:
+        """
+        Load the info and tracks of one playlist.
+        
+        Args:
+            playlist_url: Spotify playlist URL
+            
+        Returns:
+            Dictionary with playlist info and Spotify track DataFrame
+        """
+        playlist_info = self.spotify_service.get_playlist_info(playlist_url)
+        spotify_df = self.spotify_service.get_playlist_tracks(
+            playlist_url,
+            concurrent=playlist_info['track_count'] > PAGE_SIZE,
+            snapshot_id=playlist_info['snapshot_id']
+        )
+        
+        return {
+            'info': playlist_info,
+            'tracks': spotify_df
+        }
+    
+    def search_unique_tracks(self, spotify_dfs: List[pd.DataFrame], top_results: int = 3) -> Dict[str, Dict]:
+        """
+        Search YouTube Music once for every distinct track across playlists.
+        
+        Args:
+            spotify_dfs: DataFrames with Spotify track data
+            top_results: Number of top YouTube results to consider per track
+            
+        Returns:
+            Dictionary mapping search keys to combined result records
+        """
+        non_empty = [df for df in spotify_dfs if len(df) > 0]
+        if not non_empty:
+            return {}
+        
+        union_df = pd.concat(non_empty, ignore_index=True)
+        keys = search_keys(union_df)
+        unique_df = union_df[~keys.duplicated()].reset_index(drop=True)
+        
+        print(f"Searching {len(unique_df)} unique tracks out of {len(union_df)} total")
+        
+        results_df = self.youtube_service.search_playlist_tracks(
+            unique_df, top_results=top_results, max_workers=DEFAULT_SEARCH_WORKERS
+        )
+        
+        # Bulk conversions never re-pick matches, so don't keep every candidate until exit
+        self.youtube_service.candidate_store.clear()
+        return dict(zip(search_keys(unique_df), results_df.to_dict('records')))
+    
+    def fan_out(self, spotify_df: pd.DataFrame, results_by_key: Dict[str, Dict]) -> pd.DataFrame:
+        """
+        Build one playlist's combined results from shared search results.
+        
+        Args:
+            spotify_df: DataFrame with the playlist's Spotify track data
+            results_by_key: Combined result records keyed by search key
+            
+        Returns:
+            DataFrame with combined Spotify and YouTube Music data
+        """
+        records = [
+            {**results_by_key[key], **spotify_record}
+            for key, spotify_record in zip(search_keys(spotify_df), spotify_df.to_dict('records'))
+        ]
+        return compact_dataframe(pd.DataFrame(records))
+    
+    def convert_playlists(self, playlist_urls: List[str], top_results: int = 3) -> Dict[str, Dict]:
+        """
+        Convert several playlists, searching shared tracks only once.
+        
+        Args:
+            playlist_urls: Spotify playlist URLs
+            top_results: Number of top YouTube results to consider per track
+            
+        Returns:
+            Dictionary mapping each playlist URL to its info and combined results
+        """
+        playlists = {}
+        for playlist_url in dict.fromkeys(playlist_urls):
+            print(f"Loading playlist: {playlist_url}")
+            playlists[playlist_url] = self.load_playlist(playlist_url)
+        
+        results_by_key = self.search_unique_tracks(
+            [playlist['tracks'] for playlist in playlists.values()],
+            top_results=top_results
+        )
+        
+        return {
+            playlist_url: {
+                'info': playlist['info'],
+                'results': self.fan_out(playlist['tracks'], results_by_key)
+            }
+            for playlist_url, playlist in playlists.items()
+        }
+    
+    def validate_links(self, links: Iterable[str]) -> Tuple[List[str], List[str], int]:
+        """
+        Validate playlist links and deduplicate them by playlist ID in one pass.
+        
+        Args:
+            links: Spotify playlist URLs or spotify:playlist: URIs
+            
+        Returns:
+            Tuple of (unique playlist IDs in manifest order, invalid links, duplicate count)
+        """
+        playlist_ids = {}
+        invalid_links = []
+        duplicates = 0
+        
+        for link in links:
+            try:
+                playlist_id = self.spotify_service.extract_playlist_id(link)
+            except ValueError:
+                invalid_links.append(link)
+                continue
+            
+            if playlist_id in playlist_ids:
+                duplicates += 1
+            else:
+                playlist_ids[playlist_id] = None
+        
+        return list(playlist_ids), invalid_links, duplicates
+    
+    def _ingest_playlist(self, playlist_id: str, output_dir: Path, top_results: int) -> Path:
+        """
+        Convert one playlist and write its combined results to a CSV file.
+        
+        Args:
+            playlist_id: Spotify playlist ID
+            output_dir: Directory for per-playlist result files
+            top_results: Number of top YouTube results to consider per track
+            
+        Returns:
+            Path of the written CSV file
+        """
+        playlist = self.load_playlist(f"https://open.spotify.com/playlist/{playlist_id}")
+        
+        results_df = playlist['tracks']
+        if len(results_df) > 0:
+            results_df = self.youtube_service.search_playlist_tracks(results_df, top_results=top_results)
+            self.youtube_service.candidate_store.clear()
+        
+        # Write to a temporary file first so finished files are never partial
+        output_path = output_dir / f"{playlist_id}.csv"
+        tmp_path = output_dir / f".{playlist_id}.csv.tmp"
+        results_df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, output_path)
+        
+        return output_path
+    
+    def ingest_manifest(self, 
+                        manifest_path: str, 
+                        output_dir: str = "data/exports",
+                        max_workers: int = 4,
+                        top_results: int = 3) -> Dict:
+        """
+        Convert every playlist listed in a manifest file.
+        
+        Links are validated and deduplicated up front, then playlists are
+        converted by a bounded worker pool. Each playlist's results are written
+        to ``<output_dir>/<playlist_id>.csv`` as soon as it finishes, and a
+        ``summary.json`` is written at the end.
+        
+        Args:
+            manifest_path: Text, CSV or JSONL file of playlist URLs / URIs
+            output_dir: Directory for per-playlist result files
+            max_workers: Maximum number of playlists converted concurrently
+            top_results: Number of top YouTube results to consider per track
+            
+        Returns:
+            Summary dictionary with succeeded, failed and invalid entries
+        """
+        playlist_ids, invalid_links, duplicates = self.validate_links(read_manifest(manifest_path))
+        
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        print(f"Ingesting {len(playlist_ids)} playlists "
+              f"({len(invalid_links)} invalid, {duplicates} duplicates skipped)")
+        
+        summary = {
+            'manifest': str(manifest_path),
+            'playlists': len(playlist_ids),
+            'duplicates': duplicates,
+            'invalid': invalid_links,
+            'succeeded': {},
+            'failed': {}
+        }
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._ingest_playlist, playlist_id, output_dir, top_results): playlist_id
+                for playlist_id in playlist_ids
+            }
+            
+            for completed, future in enumerate(as_completed(futures), start=1):
+                playlist_id = futures[future]
+                try:
+                    output_path = future.result()
+                    summary['succeeded'][playlist_id] = str(output_path)
+                    print(f"[{completed}/{len(futures)}] ✅ {playlist_id} -> {output_path}")
+                except Exception as e:
+                    summary['failed'][playlist_id] = str(e)
+                    print(f"[{completed}/{len(futures)}] ❌ {playlist_id}: {e}")
+        
+        write_json(output_dir / 'summary.json', summary)
+        return summary
+
+
+def convert_playlists(playlist_urls: List[str], top_results: int = 3) -> Dict[str, Dict]:
+    """
+    Convenience function to convert several Spotify playlists at once.
+    
+    Args:
+        playlist_urls: Spotify playlist URLs
+        top_results: Number of top results per track
+        
+    Returns:
+        Dictionary mapping each playlist URL to its info and combined results
+    """
+    service = BatchConversionService()
+    return service.convert_playlists(playlist_urls, top_results)
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Convert every Spotify playlist listed in a manifest file")
+    parser.add_argument("manifest", help="Text, CSV or JSONL file of playlist URLs / spotify: URIs")
+    parser.add_argument("--output-dir", default="data/exports", help="Directory for per-playlist CSV files")
+    parser.add_argument("--workers", type=int, default=4, help="Playlists converted concurrently")
+    parser.add_argument("--top-results", type=int, default=3, help="YouTube results considered per track")
+    args = parser.parse_args()
+    
+    try:
+        service = BatchConversionService()
+        summary = service.ingest_manifest(
+            args.manifest,
+            output_dir=args.output_dir,
+            max_workers=args.workers,
+            top_results=args.top_results
+        )
+        print(f"\n✅ {len(summary['succeeded'])} converted, ❌ {len(summary['failed'])} failed, "
+              f"⚠️ {len(summary['invalid'])} invalid")
+    except Exception as e:
+        print(f"❌ Error: {e}")
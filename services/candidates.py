@@ -0,0 +1,299 @@
+"""
+Candidate store keeping every scored YouTube Music candidate per track.
+
+Searching is the expensive part of a conversion; picking a match is not.
+The store keeps all candidates found for each track in one compact
+columnar DataFrame, so confidence filtering, ``get_best_matches`` and
+manual re-picks are answered from memory instead of searching again.
+"""
+
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+from services.scoring import SCORER_VERSION
+from utils.dataframes import compact_dataframe, records_to_dataframe
+from utils.image_cache import cache_image
+from utils.text import normalize_key
+
+
+# Spotify columns carried into combined results
+SPOTIFY_COLUMNS = ['track_id', 'track_name', 'artist_name', 'album_name', 'spotify_url', 'isrc', 'duration_ms']
+
+# Values used when optional Spotify columns are missing
+SPOTIFY_DEFAULTS = {'track_id': '', 'isrc': '', 'duration_ms': None}
+
+# YouTube Music columns of combined results
+MATCH_COLUMNS = [
+    'youtube_title', 'youtube_artist', 'youtube_album', 'youtube_duration', 'youtube_duration_seconds',
+    'youtube_url', 'youtube_video_id', 'youtube_thumbnail', 'youtube_thumbnail_local', 'match_confidence',
+    'scorer_version'
+]
+
+# Columns stored per candidate; the artist list is kept so candidates can be rescored
+CANDIDATE_COLUMNS = MATCH_COLUMNS + ['youtube_artists']
+
+# YouTube Music data of a track without a match
+EMPTY_MATCH = {
+    'youtube_title': '',
+    'youtube_artist': '',
+    'youtube_album': '',
+    'youtube_duration': '',
+    'youtube_duration_seconds': None,
+    'youtube_url': '',
+    'youtube_video_id': '',
+    'youtube_thumbnail': '',
+    'youtube_thumbnail_local': None,
+    'match_confidence': 0.0,
+    'scorer_version': SCORER_VERSION
+}
+
+# Pending rows are merged into the columnar frame once this many accumulate
+PENDING_FLUSH_ROWS = 5000
+
+
+def candidate_key(artist: str, track_name: str, track_id: Optional[str] = None) -> str:
+    """
+    Build the key candidates are stored under.
+    
+    Tracks are keyed by their Spotify track ID, so re-picking the match of
+    one track never changes another that happens to normalize alike. Tracks
+    without an ID fall back to their normalized artist and title.
+    
+    Args:
+        artist: Artist name
+        track_name: Track name
+        track_id: Spotify track ID (None or empty if unknown)
+        
+    Returns:
+        Candidate key
+    """
+    if isinstance(track_id, str) and track_id:
+        return track_id
+    return normalize_key(str(artist)) + '\x1f' + normalize_key(str(track_name))
+
+
+def candidate_keys(spotify_df: pd.DataFrame) -> List[str]:
+    """
+    Build the candidate key of every track in a DataFrame.
+    
+    Args:
+        spotify_df: DataFrame with Spotify track data
+        
+    Returns:
+        List of keys in row order
+    """
+    track_ids = spotify_df['track_id'] if 'track_id' in spotify_df else [None] * len(spotify_df)
+    return [
+        candidate_key(artist, track, track_id)
+        for artist, track, track_id in zip(spotify_df['artist_name'], spotify_df['track_name'], track_ids)
+    ]
+
+
+class CandidateStore:
+    """Thread-safe store of scored candidates per track, with the current pick for each."""
+    
+    def __init__(self):
+        """Initialize an empty candidate store."""
+        self._lock = threading.Lock()
+        
+        # Consolidated candidates, plus rows added since the last merge
+        self._frame = pd.DataFrame(columns=CANDIDATE_COLUMNS)
+        self._pending: List[Dict] = []
+        self._size = 0
+        
+        # Rows of replaced spans, dropped once they outnumber the live ones
+        self._dead = 0
+        
+        # Key -> (start, stop) rows of its candidates, best first; key -> row of a manual pick
+        self._spans: Dict[str, Tuple[int, int]] = {}
+        self._picks: Dict[str, int] = {}
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._spans
+    
+    def __len__(self) -> int:
+        return len(self._spans)
+    
+    def add(self, key: str, candidates: List[Dict]):
+        """
+        Store the scored candidates of a track, replacing earlier ones.
+        
+        Args:
+            key: Key from ``candidate_key``
+            candidates: Scored candidates, best first
+        """
+        with self._lock:
+            if key in self._spans:
+                old_start, old_stop = self._spans[key]
+                self._dead += old_stop - old_start
+            
+            start = self._size
+            self._pending.extend(candidates)
+            self._size += len(candidates)
+            self._spans[key] = (start, self._size)
+            self._picks.pop(key, None)
+            
+            if len(self._pending) >= PENDING_FLUSH_ROWS:
+                self._consolidate()
+    
+    def clear(self):
+        """Drop all stored candidates and picks."""
+        with self._lock:
+            self._frame = pd.DataFrame(columns=CANDIDATE_COLUMNS)
+            self._pending = []
+            self._size = 0
+            self._dead = 0
+            self._spans = {}
+            self._picks = {}
+    
+    def _consolidate(self) -> pd.DataFrame:
+        """
+        Append pending candidates to the columnar frame, dropping replaced
+        rows once they make up most of it (caller holds the lock).
+        """
+        if self._pending:
+            added = records_to_dataframe(self._pending, CANDIDATE_COLUMNS)
+            frames = [frame for frame in (self._frame, added) if len(frame) > 0]
+            self._frame = compact_dataframe(pd.concat(frames, ignore_index=True))
+            self._pending = []
+        
+        if self._dead and self._dead * 2 >= len(self._frame):
+            self._compact()
+        
+        return self._frame
+    
+    def _compact(self):
+        """Rebuild the frame from live spans only, remapping spans and picks (caller holds the lock)."""
+        spans = {}
+        picks = {}
+        rows = []
+        size = 0
+        
+        for key, (start, stop) in self._spans.items():
+            spans[key] = (size, size + stop - start)
+            if key in self._picks:
+                picks[key] = size + self._picks[key] - start
+            rows.append(np.arange(start, stop))
+            size += stop - start
+        
+        taken = np.concatenate(rows) if rows else np.array([], dtype=np.int64)
+        self._frame = self._frame.iloc[taken].reset_index(drop=True)
+        self._spans = spans
+        self._picks = picks
+        self._size = size
+        self._dead = 0
+    
+    def get(self, key: str) -> pd.DataFrame:
+        """
+        Get all candidates of a track.
+        
+        Args:
+            key: Key from ``candidate_key``
+            
+        Returns:
+            DataFrame of candidates, best first (empty if the track is unknown)
+        """
+        with self._lock:
+            frame = self._consolidate()
+            start, stop = self._spans.get(key, (0, 0))
+            return frame.iloc[start:stop]
+    
+    def select(self, key: str, video_id: str) -> Dict:
+        """
+        Pick a different candidate as the match for a track.
+        
+        Args:
+            key: Key from ``candidate_key``
+            video_id: YouTube video ID of the candidate to pick
+            
+        Returns:
+            The picked candidate
+            
+        Raises:
+            ValueError: If the track has no candidate with this video ID
+        """
+        with self._lock:
+            frame = self._consolidate()
+            start, stop = self._spans.get(key, (0, 0))
+            matches = np.flatnonzero(frame['youtube_video_id'].iloc[start:stop].to_numpy() == video_id)
+            if len(matches) == 0:
+                raise ValueError(f"No candidate {video_id} stored for this track")
+            
+            row = start + int(matches[0])
+            self._picks[key] = row
+            candidate = frame.iloc[row].to_dict()
+        
+        # Thumbnails are only cached up front for the best candidate
+        if candidate['youtube_thumbnail'] and not candidate['youtube_thumbnail_local']:
+            candidate['youtube_thumbnail_local'] = cache_image(candidate['youtube_thumbnail'])
+            with self._lock:
+                # The frame may have been compacted meanwhile; the pick follows its row
+                row = self._picks.get(key)
+                if row is not None and row < len(self._frame):
+                    column = self._frame.columns.get_loc('youtube_thumbnail_local')
+                    self._frame.iloc[row, column] = candidate['youtube_thumbnail_local']
+        
+        return candidate
+    
+    def matches(self, keys: Sequence[str]) -> pd.DataFrame:
+        """
+        Get the current pick for each track: the manual pick if there is one,
+        otherwise the best candidate.
+        
+        Args:
+            keys: Keys from ``candidate_key``
+            
+        Returns:
+            DataFrame with the YouTube Music columns, one row per key
+            (empty match data for tracks without candidates)
+        """
+        with self._lock:
+            frame = self._consolidate()
+            positions = np.array([
+                self._picks.get(key, span[0]) if span[1] > span[0] else -1
+                for key, span in ((key, self._spans.get(key, (0, 0))) for key in keys)
+            ], dtype=np.int64)
+        
+        found = positions >= 0
+        if not found.any():
+            return pd.DataFrame([EMPTY_MATCH] * len(positions), columns=MATCH_COLUMNS)
+        
+        picked = frame[MATCH_COLUMNS].iloc[np.where(found, positions, positions[found][0])].reset_index(drop=True)
+        picked = picked.astype({column: object for column in MATCH_COLUMNS if column != 'match_confidence'})
+        
+        missing = np.flatnonzero(~found)
+        if len(missing):
+            for column, value in EMPTY_MATCH.items():
+                picked.iloc[missing, picked.columns.get_loc(column)] = value
+        
+        return picked
+    
+    def results(self, spotify_df: pd.DataFrame, confidence_threshold: Optional[float] = None) -> pd.DataFrame:
+        """
+        Build combined Spotify and YouTube Music results from stored candidates.
+        
+        Produces the same columns as ``YouTubeMusicService.search_playlist_tracks``
+        without searching; tracks never searched get empty match data.
+        
+        Args:
+            spotify_df: DataFrame with Spotify track data
+            confidence_threshold: Only keep matches with at least this confidence
+            
+        Returns:
+            DataFrame with combined Spotify and YouTube Music data, indexed like spotify_df
+        """
+        keys = candidate_keys(spotify_df)
+        
+        spotify_part = pd.DataFrame({
+            column: spotify_df[column].to_numpy() if column in spotify_df else [SPOTIFY_DEFAULTS.get(column)] * len(spotify_df)
+            for column in SPOTIFY_COLUMNS
+        })
+        combined = pd.concat([spotify_part, self.matches(keys)], axis=1)
+        combined.index = spotify_df.index
+        
+        if confidence_threshold is not None:
+            combined = combined[combined['match_confidence'] >= confidence_threshold]
+        
+        return compact_dataframe(combined)
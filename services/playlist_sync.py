@@ -0,0 +1,411 @@
+"""
+Incremental playlist sync that only re-processes changed tracks.
+
+The last processed version of every playlist is stored locally. On each sync
+the current Spotify track list is diffed against it, only added tracks are
+searched on YouTube Music, and the YouTube playlist is brought in line with
+the smallest set of inserts, deletes and moves.
+"""
+
+import bisect
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+import pandas as pd
+
+from services.rescore import rescore_results
+from services.scoring import SCORER_VERSION
+from services.spotify import SpotifyService
+from services.youtube import DEFAULT_SEARCH_WORKERS, YouTubeMusicService
+from services.youtube_playlist import YouTubePlaylistService
+from utils.io import read_json, write_json
+
+
+def track_keys(spotify_df: pd.DataFrame) -> List[str]:
+    """
+    Build a stable key for every track in a playlist.
+    
+    Tracks are identified by their Spotify track ID, falling back to the
+    Spotify URL. Playlists can contain the same track more than once, so
+    each key carries the occurrence number of its track.
+    
+    Args:
+        spotify_df: DataFrame with Spotify track data
+        
+    Returns:
+        List of track keys in playlist order
+    """
+    keys = []
+    occurrences = {}
+    
+    track_ids = spotify_df['track_id'] if 'track_id' in spotify_df else [None] * len(spotify_df)
+    
+    for track_id, spotify_url in zip(track_ids, spotify_df['spotify_url']):
+        identity = track_id or spotify_url
+        occurrence = occurrences.get(identity, 0)
+        occurrences[identity] = occurrence + 1
+        keys.append(f"{identity}#{occurrence}")
+    
+    return keys
+
+
+def _stable_positions(values: List[int]) -> Set[int]:
+    """
+    Find the indexes of a longest increasing subsequence of values.
+    
+    Items on that subsequence keep their relative order, so only the
+    remaining items have to be moved.
+    
+    Args:
+        values: Previous positions of kept items, in current order
+        
+    Returns:
+        Set of indexes into values that do not need to move
+    """
+    tails = []
+    tail_indexes = []
+    predecessors = [-1] * len(values)
+    
+    for i, value in enumerate(values):
+        j = bisect.bisect_left(tails, value)
+        if j == len(tails):
+            tails.append(value)
+            tail_indexes.append(i)
+        else:
+            tails[j] = value
+            tail_indexes[j] = i
+        predecessors[i] = tail_indexes[j - 1] if j > 0 else -1
+    
+    stable = set()
+    i = tail_indexes[-1] if tail_indexes else -1
+    while i != -1:
+        stable.add(i)
+        i = predecessors[i]
+    
+    return stable
+
+
+def diff_tracks(previous_keys: List[str], current_keys: List[str]) -> Dict[str, List[int]]:
+    """
+    Compare two versions of a playlist.
+    
+    Args:
+        previous_keys: Track keys of the last processed version
+        current_keys: Track keys of the current version
+        
+    Returns:
+        Dictionary with the current positions of added, moved and kept
+        tracks, and the previous positions of removed tracks
+    """
+    previous_index = {key: i for i, key in enumerate(previous_keys)}
+    current_set = set(current_keys)
+    
+    added = [i for i, key in enumerate(current_keys) if key not in previous_index]
+    removed = [i for i, key in enumerate(previous_keys) if key not in current_set]
+    kept = [i for i, key in enumerate(current_keys) if key in previous_index]
+    
+    stable = _stable_positions([previous_index[current_keys[i]] for i in kept])
+    moved = [position for j, position in enumerate(kept) if j not in stable]
+    
+    return {
+        'added': added,
+        'removed': removed,
+        'moved': moved,
+        'kept': kept
+    }
+
+
+class PlaylistSyncService:
+    """Service class for incrementally syncing Spotify playlists to YouTube."""
+    
+    def __init__(self,
+                 youtube_service: Optional[YouTubeMusicService] = None,
+                 playlist_service: Optional[YouTubePlaylistService] = None,
+                 state_dir: str = "data/sync"):
+        """
+        Initialize the sync service.
+        
+        Args:
+            youtube_service: YouTube Music search service (created if None)
+            playlist_service: Authenticated YouTube playlist service; when None,
+                only the search results are synced
+            state_dir: Directory to store the last processed playlist versions
+        """
+        self.youtube_service = youtube_service or YouTubeMusicService()
+        self.playlist_service = playlist_service
+        self.state_dir = Path(state_dir)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _get_state_path(self, playlist_id: str) -> Path:
+        """Get the state file path for a playlist."""
+        return self.state_dir / f"{playlist_id}.json"
+    
+    def load_state(self, playlist_id: str) -> Dict:
+        """
+        Load the last processed version of a playlist.
+        
+        Args:
+            playlist_id: Spotify playlist ID
+            
+        Returns:
+            State dictionary (empty state if the playlist was never synced)
+        """
+        state = read_json(self._get_state_path(playlist_id))
+        
+        if state is None:
+            state = {
+                'playlist_id': playlist_id,
+                'tracks': [],
+                'youtube_playlist_id': None,
+                'youtube_items': []
+            }
+        
+        return state
+    
+    def save_state(self, state: Dict):
+        """
+        Store the processed version of a playlist.
+        
+        Args:
+            state: State dictionary as returned by load_state
+        """
+        write_json(self._get_state_path(state['playlist_id']), state)
+    
+    def sync(self,
+             playlist_id: str,
+             spotify_df: pd.DataFrame,
+             playlist_name: Optional[str] = None,
+             top_results: int = 3,
+             confidence_threshold: float = 0.7) -> Dict:
+        """
+        Sync a playlist, searching and updating only what changed.
+        
+        Args:
+            playlist_id: Spotify playlist ID
+            spotify_df: Current DataFrame with Spotify track data
+            playlist_name: Name for the YouTube playlist if it has to be created
+            top_results: Number of top YouTube results to consider per track
+            confidence_threshold: Minimum confidence for tracks in the YouTube playlist
+            
+        Returns:
+            Dictionary with the combined results and change counts
+        """
+        state = self.load_state(playlist_id)
+        
+        previous_records = {record['track_key']: record for record in state['tracks']}
+        current_keys = track_keys(spotify_df)
+        diff = diff_tracks(list(previous_records), current_keys)
+        
+        print(f"Sync {playlist_id}: {len(diff['added'])} added, {len(diff['removed'])} removed, "
+              f"{len(diff['moved'])} moved, {len(diff['kept'])} kept")
+        
+        # Search only the tracks that were not processed before
+        if diff['added']:
+            added_results = self.youtube_service.search_playlist_tracks(
+                spotify_df.iloc[diff['added']],
+                top_results=top_results,
+                max_workers=DEFAULT_SEARCH_WORKERS
+            )
+            for i, record in zip(diff['added'], added_results.to_dict('records')):
+                previous_records[current_keys[i]] = record
+        
+        # Matches scored by an older scorer are re-picked from cached candidates, without searching again
+        stale_keys = [current_keys[i] for i in diff['kept']
+                      if previous_records[current_keys[i]].get('scorer_version') != SCORER_VERSION]
+        if stale_keys and self.youtube_service.search_cache is not None:
+            rescored_df, _ = rescore_results(
+                pd.DataFrame([previous_records[key] for key in stale_keys]),
+                search_cache=self.youtube_service.search_cache,
+                processes=1
+            )
+            for key, record in zip(stale_keys, rescored_df.to_dict('records')):
+                previous_records[key] = record
+        
+        # Rebuild the result in current playlist order with fresh Spotify metadata
+        records = []
+        for key, spotify_record in zip(current_keys, spotify_df.to_dict('records')):
+            records.append({**previous_records[key], **spotify_record, 'track_key': key})
+        
+        youtube_result = None
+        if self.playlist_service is not None:
+            youtube_result = self._sync_youtube_playlist(
+                state,
+                records,
+                playlist_name or playlist_id,
+                confidence_threshold
+            )
+        
+        state['tracks'] = records
+        self.save_state(state)
+        
+        return {
+            'results': pd.DataFrame(records).drop(columns='track_key', errors='ignore'),
+            'tracks_added': len(diff['added']),
+            'tracks_removed': len(diff['removed']),
+            'tracks_moved': len(diff['moved']),
+            'tracks_unchanged': len(diff['kept']) - len(diff['moved']),
+            'youtube': youtube_result
+        }
+    
+    def _sync_youtube_playlist(self,
+                               state: Dict,
+                               records: List[Dict],
+                               playlist_name: str,
+                               confidence_threshold: float) -> Dict:
+        """
+        Bring the YouTube playlist in line with the current results.
+        
+        Items whose track or match disappeared are deleted, new items are
+        inserted and only items off the longest in-order run are moved.
+        Failed calls leave the stored items exactly as the playlist has them,
+        so the next sync retries them.
+        
+        Args:
+            state: Playlist state; its YouTube fields are updated in place
+            records: Current combined results in playlist order
+            playlist_name: Name for the YouTube playlist if it has to be created
+            confidence_threshold: Minimum confidence for tracks in the playlist
+            
+        Returns:
+            Dictionary with YouTube update counts
+        """
+        service = self.playlist_service
+        
+        youtube_playlist_id = state.get('youtube_playlist_id')
+        if not youtube_playlist_id:
+            playlist = service.create_playlist(
+                playlist_name,
+                "Synced from Spotify playlist",
+                'private'
+            )
+            if not playlist:
+                return {'success': False, 'error': 'Failed to create playlist'}
+            
+            youtube_playlist_id = playlist['id']
+            state['youtube_playlist_id'] = youtube_playlist_id
+            state['youtube_items'] = []
+        
+        # An item is identified by its track and the video it was matched to
+        target = [
+            (record['track_key'], record['youtube_video_id'])
+            for record in records
+            if record['youtube_video_id'] and record['match_confidence'] >= confidence_threshold
+        ]
+        target_set = set(target)
+        
+        result = {
+            'success': True,
+            'playlist_id': youtube_playlist_id,
+            'playlist_url': f"https://www.youtube.com/playlist?list={youtube_playlist_id}",
+            'items_inserted': 0,
+            'items_deleted': 0,
+            'items_moved': 0,
+            'items_failed': 0
+        }
+        
+        # Delete items that are no longer wanted; ones that fail to delete stay in the playlist
+        items = []
+        for item in state['youtube_items']:
+            if (item['track_key'], item['video_id']) in target_set:
+                items.append(item)
+            elif service.delete_playlist_item(item['item_id']):
+                result['items_deleted'] += 1
+            else:
+                result['items_failed'] += 1
+                items.append(item)
+        
+        # Items on the longest in-order run stay where they are
+        item_positions = {(item['track_key'], item['video_id']): i for i, item in enumerate(items)}
+        kept = [key for key in target if key in item_positions]
+        stable_indexes = _stable_positions([item_positions[key] for key in kept])
+        stable = {kept[i] for i in stable_indexes}
+        items_by_key = {(item['track_key'], item['video_id']): item for item in items}
+        
+        # Walk the target order, placing every other item right after its predecessor
+        current = [(item['track_key'], item['video_id']) for item in items]
+        previous_key = None
+        
+        for key in target:
+            if key not in stable:
+                remaining = [other for other in current if other != key]
+                position = remaining.index(previous_key) + 1 if previous_key is not None else 0
+                
+                if key in items_by_key:
+                    item = items_by_key[key]
+                    if not service.move_playlist_item(youtube_playlist_id, item['item_id'], key[1], position):
+                        # The item stays where it was; later items are placed relative to the last success
+                        result['items_failed'] += 1
+                        continue
+                    result['items_moved'] += 1
+                else:
+                    item_id = service.insert_playlist_item(youtube_playlist_id, key[1], position)
+                    if item_id is None:
+                        result['items_failed'] += 1
+                        continue
+                    items_by_key[key] = {'track_key': key[0], 'video_id': key[1], 'item_id': item_id}
+                    result['items_inserted'] += 1
+                
+                current = remaining
+                current.insert(position, key)
+            
+            previous_key = key
+        
+        state['youtube_items'] = [items_by_key[key] for key in current]
+        return result
+
+
+def sync_playlist(playlist_url: str,
+                  update_youtube: bool = False,
+                  top_results: int = 3,
+                  confidence_threshold: float = 0.7) -> Dict:
+    """
+    Convenience function to incrementally sync a Spotify playlist.
+    
+    Args:
+        playlist_url: Spotify playlist URL
+        update_youtube: Also update the YouTube playlist (requires saved YouTube credentials)
+        top_results: Number of top YouTube results to consider per track
+        confidence_threshold: Minimum confidence for tracks in the YouTube playlist
+        
+    Returns:
+        Dictionary with the combined results and change counts
+    """
+    spotify_service = SpotifyService()
+    playlist_info = spotify_service.get_playlist_info(playlist_url)
+    spotify_df = spotify_service.get_playlist_tracks(
+        playlist_url,
+        snapshot_id=playlist_info['snapshot_id']
+    )
+    
+    playlist_service = None
+    if update_youtube:
+        playlist_service = YouTubePlaylistService()
+        if not playlist_service.is_authenticated():
+            raise ValueError("Not authenticated. Please authenticate with YouTube first.")
+    
+    sync_service = PlaylistSyncService(playlist_service=playlist_service)
+    return sync_service.sync(
+        spotify_service.extract_playlist_id(playlist_url),
+        spotify_df,
+        playlist_name=playlist_info['name'],
+        top_results=top_results,
+        confidence_threshold=confidence_threshold
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Incrementally sync a Spotify playlist to YouTube Music")
+    parser.add_argument("playlist_url", help="Spotify playlist URL")
+    parser.add_argument("--update-youtube", action="store_true", help="Also update the YouTube playlist")
+    parser.add_argument("--threshold", type=float, default=0.7, help="Minimum match confidence")
+    args = parser.parse_args()
+    
+    try:
+        result = sync_playlist(args.playlist_url, args.update_youtube, confidence_threshold=args.threshold)
+        print(f"✅ Added: {result['tracks_added']}, removed: {result['tracks_removed']}, "
+              f"moved: {result['tracks_moved']}, unchanged: {result['tracks_unchanged']}")
+        if result['youtube']:
+            print(f"📺 YouTube: {result['youtube']}")
+    except Exception as e:
+        print(f"❌ Error: {e}")
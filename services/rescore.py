@@ -0,0 +1,235 @@
+"""
+Offline re-scoring of stored YouTube Music candidates.
+
+Recomputes match confidence for existing results from the candidates kept in
+the search cache, with no network access. Use it after changing the scorer to
+see which matches move, or to bring results tagged with an older
+``SCORER_VERSION`` up to date without searching again.
+"""
+
+import os
+from multiprocessing import Pool
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from services.candidates import EMPTY_MATCH, MATCH_COLUMNS
+from services.scoring import SCORER_VERSION, score_candidates
+from services.youtube import YouTubeMusicService
+from utils.dataframes import compact_dataframe
+from utils.search_cache import SearchCache, get_search_cache
+
+
+# Below this many candidates, starting worker processes costs more than it saves
+MIN_PARALLEL_CANDIDATES = 20000
+
+# Candidates scored per worker task
+SCORE_CHUNK_SIZE = 10000
+
+
+def stored_candidates(search_cache: SearchCache, record: Dict) -> List[Dict]:
+    """
+    Collect every cached candidate that could match a result row.
+    
+    Covers all search tiers for the track (any filter or limit, primary
+    artist, title only) and the track list of its album.
+    
+    Args:
+        search_cache: Search cache to read from
+        record: Combined result row
+        
+    Returns:
+        List of unscored candidates, de-duplicated by video ID
+    """
+    artist = str(record['artist_name'])
+    track_name = str(record['track_name'])
+    primary_artist = artist.split(', ')[0]
+    
+    lookups = [(artist, track_name), (primary_artist, track_name), ('', track_name)]
+    if record.get('album_name'):
+        lookups.append((primary_artist, str(record['album_name'])))
+    
+    candidates = []
+    seen_video_ids = set()
+    for lookup in dict.fromkeys(lookups):
+        for entry in search_cache.get_track_entries(*lookup):
+            for candidate in entry:
+                if candidate['youtube_video_id'] not in seen_video_ids:
+                    seen_video_ids.add(candidate['youtube_video_id'])
+                    candidates.append(candidate)
+    
+    return candidates
+
+
+def _score_chunk(columns: Tuple[list, ...]) -> np.ndarray:
+    """Score one chunk of candidate columns (runs in a worker process)."""
+    return score_candidates(*columns)
+
+
+def rescore_candidates(original_artists: List[str], 
+                       original_tracks: List[str], 
+                       candidate_lists: List[List[Dict]], 
+                       processes: Optional[int] = None, 
+                       durations_ms: Optional[List[Optional[int]]] = None) -> List[List[Dict]]:
+    """
+    Score each track's candidates with the current scorer.
+    
+    Large workloads are split into chunks and scored on a process pool.
+    
+    Args:
+        original_artists: Artist name of each track
+        original_tracks: Track name of each track
+        candidate_lists: Unscored candidates of each track
+        processes: Worker processes (defaults to the CPU count; 1 scores in-process)
+        durations_ms: Spotify duration of each track (None where unknown)
+        
+    Returns:
+        Candidates of each track with ``match_confidence`` and ``scorer_version`` set
+    """
+    if durations_ms is None:
+        durations_ms = [None] * len(candidate_lists)
+    
+    artists, tracks, titles, yt_artists, track_durations, yt_durations = [], [], [], [], [], []
+    for artist, track, duration_ms, candidates in zip(original_artists, original_tracks, durations_ms, candidate_lists):
+        for candidate in candidates:
+            artists.append(artist)
+            tracks.append(track)
+            titles.append(candidate['youtube_title'])
+            yt_artists.append(candidate['youtube_artists'])
+            track_durations.append(duration_ms)
+            yt_durations.append(
+                candidate.get('youtube_duration') if candidate.get('youtube_duration_seconds') is None
+                else candidate['youtube_duration_seconds']
+            )
+    
+    columns = (artists, tracks, titles, yt_artists, track_durations, yt_durations)
+    processes = processes or os.cpu_count() or 1
+    if processes <= 1 or len(titles) < MIN_PARALLEL_CANDIDATES:
+        scores = score_candidates(*columns)
+    else:
+        chunks = [
+            tuple(column[i:i + SCORE_CHUNK_SIZE] for column in columns)
+            for i in range(0, len(titles), SCORE_CHUNK_SIZE)
+        ]
+        with Pool(processes) as pool:
+            scores = np.concatenate(pool.map(_score_chunk, chunks))
+    
+    scored = []
+    position = 0
+    for candidates in candidate_lists:
+        scored.append([
+            {**candidate, 'match_confidence': float(score), 'scorer_version': SCORER_VERSION}
+            for candidate, score in zip(candidates, scores[position:position + len(candidates)])
+        ])
+        position += len(candidates)
+    
+    return scored
+
+
+def rescore_results(results_df: pd.DataFrame, 
+                    search_cache: Optional[SearchCache] = None, 
+                    processes: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Re-pick the best match of every result row from its cached candidates.
+    
+    Rows without cached candidates are left unchanged, including their
+    ``scorer_version``.
+    
+    Args:
+        results_df: Combined Spotify and YouTube Music results
+        search_cache: Search cache to read candidates from (defaults to the global one)
+        processes: Worker processes for scoring
+        
+    Returns:
+        Tuple of (re-scored results indexed like results_df, diff report with
+        one row per re-scored track)
+    """
+    search_cache = search_cache or get_search_cache()
+    records = results_df.to_dict('records')
+    
+    scored = rescore_candidates(
+        [str(record['artist_name']) for record in records],
+        [str(record['track_name']) for record in records],
+        [stored_candidates(search_cache, record) for record in records],
+        processes,
+        [record.get('duration_ms') for record in records]
+    )
+    
+    new_records = []
+    report = []
+    for record, results in zip(records, scored):
+        if not results:
+            new_records.append(record)
+            continue
+        
+        duration_ms = record.get('duration_ms')
+        best = YouTubeMusicService._rank_results(results, None if pd.isna(duration_ms) else int(duration_ms))[0]
+        
+        new_record = {**record, **{column: best.get(column) for column in MATCH_COLUMNS}}
+        
+        # Thumbnails aren't downloaded offline; keep the local copy only if the match is unchanged
+        same_match = best['youtube_video_id'] == record.get('youtube_video_id')
+        new_record['youtube_thumbnail_local'] = record.get('youtube_thumbnail_local') if same_match else None
+        new_records.append(new_record)
+        
+        report.append({
+            'track_id': record.get('track_id', ''),
+            'artist_name': record['artist_name'],
+            'track_name': record['track_name'],
+            'old_video_id': record.get('youtube_video_id', ''),
+            'new_video_id': best['youtube_video_id'],
+            'old_confidence': record.get('match_confidence'),
+            'new_confidence': best['match_confidence'],
+            'old_scorer_version': record.get('scorer_version'),
+            'match_changed': not same_match
+        })
+    
+    return (
+        compact_dataframe(pd.DataFrame(new_records, index=results_df.index)),
+        pd.DataFrame(report)
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Re-score stored YouTube Music candidates without any network access")
+    parser.add_argument("results", help="Results CSV from the app, batch conversion or an export")
+    parser.add_argument("--output", help="Path for the re-scored results (defaults to overwriting the input)")
+    parser.add_argument("--report", default="rescore_report.csv", help="Path for the diff report")
+    parser.add_argument("--processes", type=int, help="Worker processes (defaults to the CPU count)")
+    parser.add_argument("--threshold", type=float, default=0.7, help="Confidence threshold for the summary")
+    parser.add_argument("--stale-only", action="store_true", help=f"Only re-score rows not tagged with scorer version {SCORER_VERSION}")
+    args = parser.parse_args()
+    
+    try:
+        results_df = pd.read_csv(args.results)
+        
+        # Empty text cells come back as NaN; restore them as the empty strings they were written from
+        for column, value in EMPTY_MATCH.items():
+            if isinstance(value, str) and column in results_df:
+                results_df[column] = results_df[column].fillna('')
+        
+        selected = results_df
+        if args.stale_only and 'scorer_version' in results_df:
+            selected = results_df[results_df['scorer_version'] != SCORER_VERSION]
+        
+        rescored_df, report_df = rescore_results(selected, processes=args.processes)
+        results_df = pd.concat([results_df.drop(index=selected.index), rescored_df]).sort_index()
+        
+        results_df.to_csv(args.output or args.results, index=False)
+        report_df.to_csv(args.report, index=False)
+        
+        if len(report_df):
+            was_confident = report_df['old_confidence'].astype(float) >= args.threshold
+            is_confident = report_df['new_confidence'] >= args.threshold
+            print(f"Re-scored {len(report_df)}/{len(selected)} tracks with scorer version {SCORER_VERSION}")
+            print(f"🔁 {int(report_df['match_changed'].sum())} matches changed")
+            print(f"⬆️ {int((is_confident & ~was_confident).sum())} now above {args.threshold}, "
+                  f"⬇️ {int((was_confident & ~is_confident).sum())} now below")
+        else:
+            print("No cached candidates found for these tracks")
+        
+        print(f"💾 Results saved to: {args.output or args.results}, report saved to: {args.report}")
+    except Exception as e:
+        print(f"❌ Error: {e}")
@@ -0,0 +1,238 @@
+"""
+Confidence scoring for YouTube Music candidates.
+
+The only implementation of the match-confidence rules: title (0.5, or 0.3
+for a partial word match), artist (0.4, or 0.2 partial), a 0.1 bonus for an
+exact title and artist, and the duration bonus or penalty. Candidates are
+scored in batches: every distinct string is normalized and split only once,
+containment checks run once per distinct (original, candidate) pair, and the
+score components are combined as NumPy arrays. Durations are parsed and
+compared for all candidates in one pass.
+"""
+
+from typing import Iterable, Optional, Sequence
+import numpy as np
+import pandas as pd
+
+from utils.text import normalize_text
+
+
+# Bump whenever the scores change, so stored scores from older versions get recomputed
+SCORER_VERSION = 3
+
+# Candidates within this many seconds of the Spotify duration earn a bonus
+DURATION_TOLERANCE_SECONDS = 5.0
+DURATION_BONUS = 0.1
+
+# Candidates further off than this many seconds, or this fraction of the track
+# length if larger, are penalized (extended mixes, hour-long loops)
+DURATION_MISMATCH_SECONDS = 30.0
+DURATION_MISMATCH_RATIO = 0.25
+DURATION_PENALTY = 0.3
+
+
+def _factorize(values: Iterable, count: int) -> tuple:
+    """Encode values as integer codes plus the list of distinct values."""
+    index = {}
+    codes = np.fromiter((index.setdefault(value, len(index)) for value in values), dtype=np.int64, count=count)
+    return codes, list(index)
+
+
+def _pair_codes(left: np.ndarray, right: np.ndarray, right_size: int) -> tuple:
+    """Encode (left, right) code pairs as distinct pairs plus an inverse index."""
+    base = max(right_size, 1)
+    pairs, inverse = np.unique(left * base + right, return_inverse=True)
+    return pairs // base, pairs % base, inverse
+
+
+def parse_durations(values: Iterable) -> np.ndarray:
+    """
+    Convert durations to seconds.
+    
+    Accepts numbers of seconds and display strings such as ``"3:45"`` or
+    ``"1:02:03"``, in any mix.
+    
+    Args:
+        values: Durations to convert
+        
+    Returns:
+        Array of seconds, NaN where a duration is missing or unparseable
+    """
+    series = pd.Series(list(values), dtype=object)
+    seconds = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, copy=True)
+    
+    is_text = series.map(lambda value: isinstance(value, str) and ':' in value).to_numpy(dtype=bool)
+    if not is_text.any():
+        return seconds
+    
+    # Split "h:mm:ss" into columns and fold them left to right; shorter rows end in NaN
+    parts = series[is_text].str.strip().str.split(':', expand=True)
+    numbers = parts.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+    present = parts.notna().to_numpy()
+    
+    total = np.zeros(len(parts))
+    for column in range(numbers.shape[1]):
+        total = np.where(present[:, column], total * 60 + numbers[:, column], total)
+    
+    # Any non-numeric part ("", "live") makes the whole duration unknown
+    valid = ~(present & np.isnan(numbers)).any(axis=1)
+    seconds[is_text] = np.where(valid, total, np.nan)
+    return seconds
+
+
+def duration_scores(track_durations_ms: Iterable, yt_durations: Iterable) -> np.ndarray:
+    """
+    Score how well candidate durations agree with the Spotify durations.
+    
+    Args:
+        track_durations_ms: Spotify duration in milliseconds for each candidate
+        yt_durations: Duration of each candidate, in seconds or as a display string
+        
+    Returns:
+        Array of ``DURATION_BONUS`` within the tolerance, ``-DURATION_PENALTY``
+        beyond the mismatch window, and 0 in between or when either duration
+        is unknown
+    """
+    track_seconds = parse_durations(track_durations_ms)
+    track_seconds[track_seconds <= 0] = np.nan
+    track_seconds = track_seconds / 1000
+    
+    delta = np.abs(parse_durations(yt_durations) - track_seconds)
+    window = np.maximum(DURATION_MISMATCH_SECONDS, track_seconds * DURATION_MISMATCH_RATIO)
+    
+    return np.where(
+        delta <= DURATION_TOLERANCE_SECONDS,
+        DURATION_BONUS,
+        np.where(delta > window, -DURATION_PENALTY, 0.0)
+    )
+
+
+def score_candidates(original_artists: Sequence[str], 
+                     original_tracks: Sequence[str], 
+                     yt_titles: Sequence[str], 
+                     yt_artists: Sequence[Iterable[str]], 
+                     track_durations_ms: Optional[Sequence] = None, 
+                     yt_durations: Optional[Sequence] = None) -> np.ndarray:
+    """
+    Score candidates against the tracks they were found for.
+    
+    All arguments are parallel columns with one entry per candidate, so
+    one track's original artist and name repeat for each of its candidates.
+    Durations are only compared when both duration columns are given.
+    
+    Args:
+        original_artists: Original artist name for each candidate
+        original_tracks: Original track name for each candidate
+        yt_titles: YouTube Music title of each candidate
+        yt_artists: YouTube Music artist names of each candidate
+        track_durations_ms: Spotify duration in milliseconds for each candidate
+        yt_durations: Duration of each candidate, in seconds or as a display string
+        
+    Returns:
+        Array of confidence scores between 0 and 1
+        
+    Raises:
+        ValueError: If the columns have different lengths
+    """
+    count = len(yt_titles)
+    if not len(original_artists) == len(original_tracks) == len(yt_artists) == count:
+        raise ValueError("All candidate columns must have the same length")
+    if (track_durations_ms is None) != (yt_durations is None):
+        raise ValueError("Both duration columns must be given, or neither")
+    if yt_durations is not None and not len(track_durations_ms) == len(yt_durations) == count:
+        raise ValueError("All candidate columns must have the same length")
+    
+    # Normalize each distinct string once
+    track_codes, tracks = _factorize(original_tracks, count)
+    tracks_norm = [normalize_text(track) for track in tracks]
+    track_words = [[word for word in track.split() if len(word) > 2] for track in tracks_norm]
+    
+    artist_codes, artists = _factorize(original_artists, count)
+    artists_norm = [normalize_text(artist) for artist in artists]
+    artist_words = [[word for word in artist.split() if len(word) > 2] for artist in artists_norm]
+    
+    title_codes, titles = _factorize(yt_titles, count)
+    titles_norm = [normalize_text(title) for title in titles]
+    
+    yt_artist_codes, yt_artist_lists = _factorize((tuple(names) for names in yt_artists), count)
+    yt_artists_norm = [[normalize_text(name) for name in names] for names in yt_artist_lists]
+    
+    # Track name component and exact-title flag, once per distinct (track, title) pair
+    pair_tracks, pair_titles, track_inverse = _pair_codes(track_codes, title_codes, len(titles))
+    track_pair_scores = []
+    title_pair_exact = []
+    
+    for track_code, title_code in zip(pair_tracks.tolist(), pair_titles.tolist()):
+        track = tracks_norm[track_code]
+        title = titles_norm[title_code]
+        if track in title:
+            track_pair_scores.append(0.5)
+        elif any(word in title for word in track_words[track_code]):
+            track_pair_scores.append(0.3)
+        else:
+            track_pair_scores.append(0.0)
+        title_pair_exact.append(track == title)
+    
+    # Artist component and exact-artist flag, once per distinct (artist, candidate artists) pair
+    pair_artists, pair_yt_artists, artist_inverse = _pair_codes(artist_codes, yt_artist_codes, len(yt_artist_lists))
+    artist_pair_scores = []
+    artist_pair_exact = []
+    
+    for artist_code, yt_code in zip(pair_artists.tolist(), pair_yt_artists.tolist()):
+        artist = artists_norm[artist_code]
+        names = yt_artists_norm[yt_code]
+        if any(artist in name or name in artist for name in names):
+            artist_pair_scores.append(0.4)
+        elif any(word in name for name in names for word in artist_words[artist_code]):
+            artist_pair_scores.append(0.2)
+        else:
+            artist_pair_scores.append(0.0)
+        artist_pair_exact.append(artist in names)
+    
+    # Broadcast the pair results back to candidates
+    track_score = np.array(track_pair_scores, dtype=np.float64)[track_inverse]
+    artist_score = np.array(artist_pair_scores, dtype=np.float64)[artist_inverse]
+    exact = np.array(title_pair_exact, dtype=bool)[track_inverse] & np.array(artist_pair_exact, dtype=bool)[artist_inverse]
+    exact_score = np.where(exact, 0.1, 0.0)
+    
+    if yt_durations is None:
+        duration_score = np.zeros(count)
+    else:
+        duration_score = duration_scores(track_durations_ms, yt_durations)
+    
+    # Sum in a fixed order so stored scores are reproducible to the bit
+    score = np.zeros(count) + track_score + artist_score + exact_score + duration_score
+    return np.minimum(np.maximum(score, 0.0), 1.0)
+
+
+def score_candidate_frame(candidates: pd.DataFrame) -> pd.Series:
+    """
+    Score a DataFrame of candidates.
+    
+    Args:
+        candidates: DataFrame with ``artist_name``, ``track_name``,
+            ``youtube_title`` and ``youtube_artists`` columns, and optionally
+            ``duration_ms`` and ``youtube_duration_seconds`` or ``youtube_duration``
+            
+    Returns:
+        Series of confidence scores aligned with ``candidates``
+    """
+    track_durations_ms = yt_durations = None
+    if 'duration_ms' in candidates:
+        track_durations_ms = candidates['duration_ms'].tolist()
+        if 'youtube_duration_seconds' in candidates:
+            yt_durations = candidates['youtube_duration_seconds'].tolist()
+        elif 'youtube_duration' in candidates:
+            yt_durations = candidates['youtube_duration'].astype(object).tolist()
+        else:
+            track_durations_ms = None
+    
+    scores = score_candidates(
+        candidates['artist_name'].astype(object).tolist(),
+        candidates['track_name'].astype(object).tolist(),
+        candidates['youtube_title'].astype(object).tolist(),
+        candidates['youtube_artists'].tolist(),
+        track_durations_ms,
+        yt_durations
+    )
+    return pd.Series(scores, index=candidates.index, name='match_confidence')
@@ -2,45 +2,308 @@
 Spotify API service for extracting playlist data.
 """
 
+import functools
 import os
+import random
 import re
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional
 import pandas as pd
+import requests
 import spotipy
+from spotipy.exceptions import SpotifyException
+from spotipy.cache_handler import CacheHandler
 from spotipy.oauth2 import SpotifyClientCredentials
 from dotenv import load_dotenv
+from urllib3.util.retry import Retry
+from utils.dataframes import records_to_dataframe
+from utils.io import read_json, write_json
+from utils.playlist_cache import get_playlist_cache
+from utils.rate_limit import TokenBucket
 
 
-class SpotifyService:
-    """Service class for interacting with Spotify Web API."""
+# Spotify caps playlist item pages at 100 tracks
+PAGE_SIZE = 100
+TRACK_FIELDS = (
+    'items(track(id,name,artists(name),album(name),external_urls.spotify,'
+    'external_ids.isrc,duration_ms))'
+)
+TRACK_COLUMNS = [
+    'track_id', 'track_name', 'artist_name', 'album_name', 'spotify_url', 'isrc', 'duration_ms'
+]
+
+# Maximum IDs per request on Spotify's multi-ID endpoints
+TRACKS_BATCH_SIZE = 50
+ALBUMS_BATCH_SIZE = 20
+
+# Track, album and playlist links: open.spotify.com URLs (including intl-xx) and spotify: URIs
+SPOTIFY_LINK_PATTERN = re.compile(
+    r'(?:https://open\.spotify\.com/(?:intl-[a-zA-Z-]+/)?|spotify:)(track|album|playlist)[/:]([a-zA-Z0-9]+)'
+)
+
+# Responses retried by RateLimitedSpotify. The HTTP session retries no status
+# codes itself, so a 429's Retry-After pauses every thread at once instead of
+# first being slept through inside the throttled one
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Connection errors are still retried by the HTTP session
+CONNECT_RETRIES = 3
+
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+DEFAULT_BURST = 20
+
+DEFAULT_TOKEN_CACHE_PATH = "data/.spotify_token.json"
+
+
+class SharedTokenCache(CacheHandler):
+    """
+    Access token cache shared between threads and processes.
     
-    def __init__(self):
-        """Initialize Spotify client with credentials from environment variables."""
-        load_dotenv()
+    The token is kept in memory and mirrored to a file, so restarts and other
+    worker processes reuse it until it expires instead of each requesting a
+    new one. The file is only read when the in-memory token is missing or
+    expired, and is written atomically.
+    """
+    
+    def __init__(self, cache_path: str = DEFAULT_TOKEN_CACHE_PATH):
+        """
+        Initialize token cache.
+        
+        Args:
+            cache_path: File to store the access token in
+        """
+        self.cache_path = cache_path
+        self._token_info = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _is_fresh(token_info: Optional[dict]) -> bool:
+        """Check whether a token is present and not about to expire."""
+        return bool(token_info) and token_info.get('expires_at', 0) - 60 > time.time()
+    
+    def get_cached_token(self) -> Optional[dict]:
+        """Get the cached token, reloading it from disk if the in-memory copy is stale."""
+        with self._lock:
+            if not self._is_fresh(self._token_info):
+                self._token_info = read_json(self.cache_path)
+            return self._token_info
+    
+    def save_token_to_cache(self, token_info: dict):
+        """Store a new token in memory and on disk."""
+        with self._lock:
+            self._token_info = token_info
+            try:
+                write_json(self.cache_path, token_info)
+            except OSError as e:
+                print(f"Failed to write Spotify token cache {self.cache_path}: {e}")
+
+
+def build_spotify_session() -> requests.Session:
+    """
+    Build the HTTP session for spotipy clients.
+    
+    spotipy's default session retries 429s inside urllib3, sleeping for
+    ``Retry-After`` in the calling thread before the error is raised. This
+    session only retries connection errors and returns every response as is,
+    leaving status retries to ``RateLimitedSpotify``.
+    
+    Returns:
+        Requests session
+    """
+    retry = Retry(
+        total=CONNECT_RETRIES,
+        connect=None,
+        read=False,
+        status=0,
+        status_forcelist=(),
+        allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        backoff_factor=0.3,
+        respect_retry_after_header=False
+    )
+    adapter = requests.adapters.HTTPAdapter(max_retries=retry)
+    
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class RateLimitedSpotify:
+    """
+    Proxy around a spotipy client that schedules every API call.
+    
+    Calls wait for a token from a shared TokenBucket. Rate-limited (429)
+    responses pause the bucket for the server's ``Retry-After`` (or a jittered
+    exponential backoff when the header is missing) and are retried, so
+    threads sharing the bucket slow down together instead of bursting and
+    stalling. Server errors (5xx) are retried after a backoff in the calling
+    thread only. The client must not retry statuses itself; see
+    ``build_spotify_session``.
+    """
+    
+    def __init__(self, 
+                 client: spotipy.Spotify, 
+                 bucket: TokenBucket, 
+                 max_retries: int = 5,
+                 backoff_base: float = 1.0,
+                 backoff_max: float = 30.0):
+        """
+        Initialize the rate-limited client.
+        
+        Args:
+            client: Underlying spotipy client
+            bucket: Token bucket shared by every caller
+            max_retries: Maximum number of retries per call after a 429 or 5xx
+            backoff_base: Initial backoff in seconds when Retry-After is missing
+            backoff_max: Maximum backoff in seconds
+        """
+        self._client = client
+        self.bucket = bucket
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+    
+    def __getattr__(self, name: str):
+        attribute = getattr(self._client, name)
+        if not callable(attribute):
+            return attribute
         
-        client_id = os.getenv('SPOTIFY_CLIENT_ID')
-        client_secret = os.getenv('SPOTIFY_CLIENT_SECRET')
+        @functools.wraps(attribute)
+        def scheduled(*args, **kwargs):
+            return self._call(attribute, *args, **kwargs)
         
-        if not client_id or not client_secret:
-            raise ValueError(
-                "Spotify credentials not found. Please set SPOTIFY_CLIENT_ID and "
-                "SPOTIFY_CLIENT_SECRET in your .env file."
-            )
+        return scheduled
+    
+    def _retry_delay(self, error: SpotifyException, attempt: int) -> float:
+        """
+        Get how long to wait before retrying a call.
         
-        # Set up client credentials flow
-        client_credentials_manager = SpotifyClientCredentials(
-            client_id=client_id,
-            client_secret=client_secret
-        )
+        Args:
+            error: The 429 or 5xx error raised by spotipy
+            attempt: Zero-based retry attempt
+            
+        Returns:
+            Delay in seconds
+        """
+        retry_after = (error.headers or {}).get('Retry-After')
+        
+        try:
+            # Small jitter keeps waiting threads from resuming in lockstep
+            return float(retry_after) + random.uniform(0, 1)
+        except (TypeError, ValueError):
+            # Full jitter exponential backoff
+            return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+    
+    def _call(self, method: Callable, *args, **kwargs):
+        """
+        Call a client method once a token is available, retrying 429s and 5xx.
         
-        self.sp = spotipy.Spotify(client_credentials_manager=client_credentials_manager)
+        Args:
+            method: Bound spotipy client method
+            
+        Returns:
+            The method's result
+        """
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            
+            try:
+                return method(*args, **kwargs)
+            except SpotifyException as e:
+                if e.http_status not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    raise
+                
+                delay = self._retry_delay(e, attempt)
+                if e.http_status == 429:
+                    print(f"Spotify rate limit hit, pausing requests for {delay:.1f}s")
+                    self.bucket.pause(delay)
+                else:
+                    print(f"Spotify server error {e.http_status}, retrying in {delay:.1f}s")
+                    time.sleep(delay)
+
+
+# Global rate limiter shared by every SpotifyService in the process
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+def get_spotify_rate_limiter() -> TokenBucket:
+    """
+    Get the global Spotify token bucket.
+    
+    The rate and burst size can be configured with the SPOTIFY_REQUESTS_PER_SECOND
+    and SPOTIFY_BURST environment variables.
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = TokenBucket(
+                rate=float(os.getenv('SPOTIFY_REQUESTS_PER_SECOND', DEFAULT_REQUESTS_PER_SECOND)),
+                capacity=float(os.getenv('SPOTIFY_BURST', DEFAULT_BURST))
+            )
+        return _rate_limiter
+
+
+# Global client shared by every SpotifyService in the process
+_spotify_client = None
+_spotify_client_lock = threading.Lock()
+
+def get_spotify_client() -> RateLimitedSpotify:
+    """
+    Get the global authenticated Spotify client.
+    
+    The client is created on first use with credentials from environment
+    variables and reused afterwards. Its access token is cached in the file
+    named by SPOTIFY_TOKEN_CACHE (default: data/.spotify_token.json).
+    
+    Raises:
+        ValueError: If Spotify credentials are not configured
+    """
+    global _spotify_client
+    with _spotify_client_lock:
+        if _spotify_client is None:
+            load_dotenv()
+            
+            client_id = os.getenv('SPOTIFY_CLIENT_ID')
+            client_secret = os.getenv('SPOTIFY_CLIENT_SECRET')
+            
+            if not client_id or not client_secret:
+                raise ValueError(
+                    "Spotify credentials not found. Please set SPOTIFY_CLIENT_ID and "
+                    "SPOTIFY_CLIENT_SECRET in your .env file."
+                )
+            
+            # Set up client credentials flow
+            client_credentials_manager = SpotifyClientCredentials(
+                client_id=client_id,
+                client_secret=client_secret,
+                cache_handler=SharedTokenCache(os.getenv('SPOTIFY_TOKEN_CACHE', DEFAULT_TOKEN_CACHE_PATH))
+            )
+            
+            client = spotipy.Spotify(
+                client_credentials_manager=client_credentials_manager,
+                requests_session=build_spotify_session()
+            )
+            
+            # Pace every request through the process-wide token bucket
+            _spotify_client = RateLimitedSpotify(client, get_spotify_rate_limiter())
+        return _spotify_client
+
+
+class SpotifyService:
+    """Service class for interacting with Spotify Web API."""
+    
+    def __init__(self):
+        """Initialize Spotify service with the shared process-wide client."""
+        self.sp = get_spotify_client()
     
     def extract_playlist_id(self, playlist_url: str) -> str:
         """
         Extract playlist ID from Spotify playlist URL.
         
         Args:
-            playlist_url: Spotify playlist URL
+            playlist_url: Spotify playlist URL (open.spotify.com link or spotify:playlist: URI)
             
         Returns:
             Playlist ID string
@@ -48,8 +311,8 @@ class SpotifyService:
         Raises:
             ValueError: If URL format is invalid
         """
-        # Pattern to match Spotify playlist URLs
-        pattern = r'https://open\.spotify\.com/playlist/([a-zA-Z0-9]+)'
+        # Pattern to match Spotify playlist URLs (including localized intl-xx links) and URIs
+        pattern = r'(?:https://open\.spotify\.com/(?:intl-[a-zA-Z-]+/)?playlist/|spotify:playlist:)([a-zA-Z0-9]+)'
         match = re.search(pattern, playlist_url)
         
         if not match:
@@ -57,58 +320,342 @@ class SpotifyService:
         
         return match.group(1)
     
-    def get_playlist_tracks(self, playlist_url: str) -> pd.DataFrame:
+    def _fetch_tracks_page(self, playlist_id: str, offset: int, fields: str = TRACK_FIELDS) -> dict:
         """
-        Extract track data from a Spotify playlist.
+        Fetch a single page of playlist items.
         
         Args:
-            playlist_url: Spotify playlist URL
+            playlist_id: Spotify playlist ID
+            offset: Index of the first item to return
+            fields: Spotify fields filter for the request
             
         Returns:
-            DataFrame with columns: track_name, artist_name, album_name, spotify_url
+            Raw playlist items page from the Spotify API
         """
-        playlist_id = self.extract_playlist_id(playlist_url)
+        return self.sp.playlist_tracks(
+            playlist_id, 
+            offset=offset, 
+            limit=PAGE_SIZE,
+            fields=fields
+        )
+    
+    def _iter_pages(self, playlist_id: str, concurrent: bool = False, max_workers: int = 8) -> Iterator[dict]:
+        """
+        Yield raw playlist item pages in playlist order.
         
-        # Get playlist tracks (handle pagination)
-        tracks_data = []
-        offset = 0
-        limit = 100
-        
-        while True:
-            results = self.sp.playlist_tracks(
-                playlist_id, 
-                offset=offset, 
-                limit=limit,
-                fields='items(track(name,artists(name),album(name),external_urls.spotify)),next'
-            )
+        In sequential mode pages are fetched one after another by following
+        ``next``. In concurrent mode the first page reports the playlist total,
+        every remaining offset is computed up front and fetched with a bounded
+        worker pool.
+        
+        Args:
+            playlist_id: Spotify playlist ID
+            concurrent: Fetch pages concurrently instead of following ``next``
+            max_workers: Maximum number of pages in flight when concurrent
             
-            for item in results['items']:
-                track = item['track']
-                
-                # Skip if track is None (can happen with local files or unavailable tracks)
-                if track is None:
-                    continue
+        Yields:
+            Raw playlist items pages
+        """
+        if not concurrent:
+            offset = 0
+            while True:
+                results = self._fetch_tracks_page(playlist_id, offset, f'{TRACK_FIELDS},next')
+                yield results
                 
-                # Extract track information
-                track_name = track['name']
-                artist_name = ', '.join([artist['name'] for artist in track['artists']])
-                album_name = track['album']['name']
-                spotify_url = track['external_urls']['spotify']
+                # Check if there are more tracks to fetch
+                if results['next'] is None:
+                    break
                 
-                tracks_data.append({
-                    'track_name': track_name,
-                    'artist_name': artist_name,
-                    'album_name': album_name,
-                    'spotify_url': spotify_url
-                })
+                offset += PAGE_SIZE
+            return
+        
+        first_page = self._fetch_tracks_page(playlist_id, 0, f'{TRACK_FIELDS},total')
+        yield first_page
+        
+        offsets = range(PAGE_SIZE, first_page['total'], PAGE_SIZE)
+        if not offsets:
+            return
+        
+        # executor.map hands results back in submission (playlist) order
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(lambda offset: self._fetch_tracks_page(playlist_id, offset), offsets)
+    
+    @staticmethod
+    def _parse_track(track: dict, album_name: Optional[str] = None) -> Dict:
+        """
+        Convert a Spotify track object into a track row.
+        
+        Args:
+            track: Full or simplified Spotify track object
+            album_name: Album name for simplified tracks, which carry no album
+            
+        Returns:
+            Track dictionary
+        """
+        return {
+            'track_id': track['id'],
+            'track_name': track['name'],
+            'artist_name': ', '.join([artist['name'] for artist in track['artists']]),
+            'album_name': album_name if album_name is not None else track['album']['name'],
+            'spotify_url': track['external_urls']['spotify'],
+            'isrc': (track.get('external_ids') or {}).get('isrc', ''),
+            'duration_ms': track.get('duration_ms')
+        }
+    
+    @staticmethod
+    def _parse_track_items(items: List[dict]) -> List[Dict]:
+        """
+        Convert raw playlist items into track rows.
+        
+        Args:
+            items: ``items`` list from a playlist items page
+            
+        Returns:
+            List of track dictionaries
+        """
+        tracks_data = []
+        
+        for item in items:
+            track = item['track']
+            
+            # Skip if track is None (can happen with local files or unavailable tracks)
+            if track is None:
+                continue
+            
+            tracks_data.append(SpotifyService._parse_track(track))
+        
+        return tracks_data
+    
+    def iter_playlist_tracks(self, 
+                             playlist_url: str, 
+                             concurrent: bool = False, 
+                             max_workers: int = 8,
+                             use_cache: bool = True,
+                             snapshot_id: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Yield track data from a Spotify playlist page by page.
+        
+        Tracks are yielded as soon as their page arrives, so downstream stages
+        can start before the whole playlist has been fetched. When caching is
+        enabled and the playlist's snapshot is unchanged since the last full
+        fetch, tracks come straight from the local cache without paging.
+        
+        Args:
+            playlist_url: Spotify playlist URL
+            concurrent: Fetch all pages concurrently instead of one at a time
+            max_workers: Maximum number of concurrent page requests
+            use_cache: Serve and store tracks through the local playlist cache
+            snapshot_id: Current snapshot ID if already known (saves a request)
+            
+        Yields:
+            Track dictionaries with keys: track_id, track_name, artist_name, album_name,
+            spotify_url, isrc, duration_ms
+        """
+        playlist_id = self.extract_playlist_id(playlist_url)
+        
+        if use_cache:
+            cache = get_playlist_cache()
+            snapshot_id = snapshot_id or self.get_playlist_snapshot_id(playlist_url)
+            cached_tracks = cache.get(playlist_id, snapshot_id)
+            
+            if cached_tracks is not None:
+                print(f"Using cached tracks for playlist {playlist_id} (snapshot {snapshot_id})")
+                yield from cached_tracks
+                return
+        
+        # Keep the whole playlist in memory only when it is going to be cached
+        tracks_data = [] if use_cache else None
+        for page in self._iter_pages(playlist_id, concurrent=concurrent, max_workers=max_workers):
+            page_tracks = self._parse_track_items(page['items'])
+            if use_cache:
+                tracks_data.extend(page_tracks)
+            yield from page_tracks
+        
+        # Only complete fetches reach this point, so partial playlists are never cached
+        if use_cache:
+            cache.put(playlist_id, snapshot_id, tracks_data)
+    
+    def iter_playlist_track_chunks(self, 
+                                   playlist_url: str, 
+                                   chunk_size: int = PAGE_SIZE,
+                                   concurrent: bool = False,
+                                   max_workers: int = 8,
+                                   use_cache: bool = True,
+                                   snapshot_id: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield track data from a Spotify playlist as DataFrame chunks.
+        
+        Chunk indexes continue from one chunk to the next, so concatenating
+        the chunks gives the same frame as ``get_playlist_tracks``.
+        
+        Args:
+            playlist_url: Spotify playlist URL
+            chunk_size: Number of tracks per chunk
+            concurrent: Fetch all pages concurrently instead of one at a time
+            max_workers: Maximum number of concurrent page requests
+            use_cache: Serve and store tracks through the local playlist cache
+            snapshot_id: Current snapshot ID if already known (saves a request)
+            
+        Yields:
+            DataFrames with columns: track_id, track_name, artist_name, album_name,
+            spotify_url, isrc, duration_ms
+        """
+        chunk = []
+        start = 0
+        
+        tracks = self.iter_playlist_tracks(
+            playlist_url,
+            concurrent=concurrent,
+            max_workers=max_workers,
+            use_cache=use_cache,
+            snapshot_id=snapshot_id
+        )
+        
+        for track in tracks:
+            chunk.append(track)
             
-            # Check if there are more tracks to fetch
-            if results['next'] is None:
-                break
+            if len(chunk) >= chunk_size:
+                yield records_to_dataframe(chunk, TRACK_COLUMNS, index=range(start, start + len(chunk)))
+                start += len(chunk)
+                chunk = []
+        
+        if chunk:
+            yield records_to_dataframe(chunk, TRACK_COLUMNS, index=range(start, start + len(chunk)))
+    
+    def get_playlist_tracks(self, 
+                            playlist_url: str, 
+                            concurrent: bool = False, 
+                            max_workers: int = 8,
+                            use_cache: bool = True,
+                            snapshot_id: Optional[str] = None) -> pd.DataFrame:
+        """
+        Extract track data from a Spotify playlist.
+        
+        Args:
+            playlist_url: Spotify playlist URL
+            concurrent: Fetch all pages concurrently instead of one at a time
+            max_workers: Maximum number of concurrent page requests
+            use_cache: Serve and store tracks through the local playlist cache
+            snapshot_id: Current snapshot ID if already known (saves a request)
             
-            offset += limit
+        Returns:
+            DataFrame with columns: track_id, track_name, artist_name, album_name,
+            spotify_url, isrc, duration_ms
+        """
+        tracks = self.iter_playlist_tracks(
+            playlist_url,
+            concurrent=concurrent,
+            max_workers=max_workers,
+            use_cache=use_cache,
+            snapshot_id=snapshot_id
+        )
         
-        return pd.DataFrame(tracks_data)
+        # Columns are filled as tracks stream in; repetitive columns become categoricals
+        return records_to_dataframe(tracks, TRACK_COLUMNS)
+    
+    def _fetch_tracks_batch(self, track_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch up to 50 tracks with one request.
+        
+        Args:
+            track_ids: Spotify track IDs
+            
+        Returns:
+            Dictionary mapping track IDs to track rows (unavailable IDs are left out)
+        """
+        results = self.sp.tracks(track_ids)
+        
+        return {
+            track_id: self._parse_track(track)
+            for track_id, track in zip(track_ids, results['tracks'])
+            if track is not None
+        }
+    
+    def _fetch_albums_batch(self, album_ids: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Fetch up to 20 albums and their track lists with one request.
+        
+        Album tracks are simplified objects without ISRCs. Albums with more
+        tracks than fit in the embedded first page are paged separately.
+        
+        Args:
+            album_ids: Spotify album IDs
+            
+        Returns:
+            Dictionary mapping album IDs to lists of track rows
+        """
+        results = self.sp.albums(album_ids)
+        albums = {}
+        
+        for album_id, album in zip(album_ids, results['albums']):
+            if album is None:
+                continue
+            
+            page = album['tracks']
+            items = list(page['items'])
+            while page['next']:
+                page = self.sp.album_tracks(album_id, limit=50, offset=len(items))
+                items.extend(page['items'])
+            
+            albums[album_id] = [self._parse_track(track, album_name=album['name']) for track in items]
+        
+        return albums
+    
+    def resolve_links(self, links: List[str], max_workers: int = 4) -> pd.DataFrame:
+        """
+        Resolve a mixed list of track, album and playlist links into tracks.
+        
+        Track IDs are fetched 50 per request and album IDs 20 per request,
+        with the batches running concurrently. Playlists are expanded with
+        ``iter_playlist_tracks``. Output rows follow the order of the links.
+        
+        Args:
+            links: Spotify open.spotify.com URLs or spotify: URIs
+            max_workers: Maximum number of batch requests in flight
+            
+        Returns:
+            DataFrame with columns: track_id, track_name, artist_name, album_name,
+            spotify_url, isrc, duration_ms
+        """
+        parsed = []
+        for link in links:
+            match = SPOTIFY_LINK_PATTERN.search(link)
+            if match:
+                parsed.append((match.group(1), match.group(2)))
+            else:
+                print(f"Skipping unsupported Spotify link: {link}")
+        
+        track_ids = list(dict.fromkeys(item_id for kind, item_id in parsed if kind == 'track'))
+        album_ids = list(dict.fromkeys(item_id for kind, item_id in parsed if kind == 'album'))
+        
+        tracks = {}
+        albums = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            track_batches = executor.map(
+                self._fetch_tracks_batch,
+                [track_ids[i:i + TRACKS_BATCH_SIZE] for i in range(0, len(track_ids), TRACKS_BATCH_SIZE)]
+            )
+            album_batches = executor.map(
+                self._fetch_albums_batch,
+                [album_ids[i:i + ALBUMS_BATCH_SIZE] for i in range(0, len(album_ids), ALBUMS_BATCH_SIZE)]
+            )
+            
+            for batch in track_batches:
+                tracks.update(batch)
+            for batch in album_batches:
+                albums.update(batch)
+        
+        rows = []
+        for kind, item_id in parsed:
+            if kind == 'track' and item_id in tracks:
+                rows.append(tracks[item_id])
+            elif kind == 'album':
+                rows.extend(albums.get(item_id, []))
+            elif kind == 'playlist':
+                rows.extend(self.iter_playlist_tracks(f"https://open.spotify.com/playlist/{item_id}"))
+        
+        return records_to_dataframe(rows, TRACK_COLUMNS)
     
     def get_playlist_info(self, playlist_url: str) -> dict:
         """
@@ -118,35 +665,55 @@ class SpotifyService:
             playlist_url: Spotify playlist URL
             
         Returns:
-            Dictionary with playlist name, description, and track count
+            Dictionary with playlist name, description, track count, owner and snapshot ID
         """
         playlist_id = self.extract_playlist_id(playlist_url)
         
         playlist = self.sp.playlist(
             playlist_id, 
-            fields='name,description,tracks.total,owner.display_name'
+            fields='name,description,tracks.total,owner.display_name,snapshot_id'
         )
         
         return {
             'name': playlist['name'],
             'description': playlist.get('description', ''),
             'track_count': playlist['tracks']['total'],
-            'owner': playlist['owner']['display_name']
+            'owner': playlist['owner']['display_name'],
+            'snapshot_id': playlist['snapshot_id']
         }
+    
+    def get_playlist_snapshot_id(self, playlist_url: str) -> str:
+        """
+        Get the current snapshot ID of a playlist.
+        
+        The snapshot ID changes whenever the playlist is modified, which makes
+        it a cheap freshness check for cached track data.
+        
+        Args:
+            playlist_url: Spotify playlist URL
+            
+        Returns:
+            Snapshot ID string
+        """
+        playlist_id = self.extract_playlist_id(playlist_url)
+        
+        playlist = self.sp.playlist(playlist_id, fields='snapshot_id')
+        return playlist['snapshot_id']
 
 
-def extract_playlist_data(playlist_url: str) -> pd.DataFrame:
+def extract_playlist_data(playlist_url: str, concurrent: bool = False) -> pd.DataFrame:
     """
     Convenience function to extract playlist data.
     
     Args:
         playlist_url: Spotify playlist URL
+        concurrent: Fetch all pages concurrently
         
     Returns:
         DataFrame with track data
     """
     service = SpotifyService()
-    return service.get_playlist_tracks(playlist_url)
+    return service.get_playlist_tracks(playlist_url, concurrent=concurrent)
 
 
 if __name__ == "__main__":
@@ -177,7 +744,7 @@ if __name__ == "__main__":
         # Save to CSV for inspection
         df.to_csv('playlist_tracks.csv', index=False)
         print(f"\nData saved to playlist_tracks.csv")
-        
+    
     except Exception as e:
         print(f"Error: {e}")
         print("\nMake sure you have:")
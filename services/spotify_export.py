@@ -0,0 +1,301 @@
+"""
+Offline ingestion of Spotify data exports and playlist CSV files.
+
+Parses Spotify account data exports (playlists, library and streaming
+history JSON) and CSVs from common export tools into the same track schema
+as ``SpotifyService.get_playlist_tracks``, so YouTube matching can run
+without any Spotify API calls.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+from urllib.parse import quote
+import pandas as pd
+
+from services.spotify import TRACK_COLUMNS
+from utils.dataframes import records_to_dataframe
+
+
+# Known header spellings (lowercased) for each track column, in priority order
+CSV_COLUMN_ALIASES = {
+    'track_name': ['track name', 'track_name', 'trackname', 'track', 'name', 'title', 'song'],
+    'artist_name': ['artist name(s)', 'artist name', 'artist_name', 'artistname', 'artists', 'artist'],
+    'album_name': ['album name', 'album_name', 'albumname', 'album'],
+    'spotify_url': ['spotify_url', 'track uri', 'spotify uri', 'uri', 'url', 'spotify - id', 'track id', 'id'],
+    'isrc': ['isrc'],
+    'duration_ms': ['duration (ms)', 'duration_ms', 'duration ms']
+}
+
+TRACK_ID_PATTERN = re.compile(
+    r'^(?:spotify:track:|https?://open\.spotify\.com/(?:intl-[a-zA-Z-]+/)?track/)?([a-zA-Z0-9]{22})$'
+)
+
+
+def _spotify_track_fields(value: Optional[str], artist_name: str, track_name: str) -> Dict:
+    """
+    Derive the track ID and Spotify URL from a URI, URL or bare track ID.
+    
+    Args:
+        value: spotify:track: URI, open.spotify.com track URL or track ID (may be empty)
+        artist_name: Artist name, used for a search link when there is no ID
+        track_name: Track name, used for a search link when there is no ID
+        
+    Returns:
+        Dictionary with track_id and spotify_url
+    """
+    value = (value or '').strip().split('?')[0]
+    match = TRACK_ID_PATTERN.match(value)
+    
+    if match:
+        track_id = match.group(1)
+        return {
+            'track_id': track_id,
+            'spotify_url': f"https://open.spotify.com/track/{track_id}"
+        }
+    
+    # Without an ID, link to a Spotify search so the row still opens somewhere useful
+    return {
+        'track_id': '',
+        'spotify_url': f"https://open.spotify.com/search/{quote(f'{artist_name} {track_name}'.strip())}"
+    }
+
+
+def _track_record(track_name: str,
+                  artist_name: str,
+                  album_name: str = '',
+                  spotify_ref: Optional[str] = None,
+                  isrc: str = '',
+                  duration_ms=None) -> Dict:
+    """Build a track record in the standard schema."""
+    track_name = (track_name or '').strip()
+    artist_name = (artist_name or '').strip()
+    
+    try:
+        duration_ms = int(float(duration_ms)) if duration_ms not in (None, '') else None
+    except (TypeError, ValueError):
+        duration_ms = None
+    
+    return {
+        'track_name': track_name,
+        'artist_name': artist_name,
+        'album_name': (album_name or '').strip(),
+        'isrc': (isrc or '').strip(),
+        'duration_ms': duration_ms,
+        **_spotify_track_fields(spotify_ref, artist_name, track_name)
+    }
+
+
+def _records_to_chunks(records: Iterable[Dict], chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Group track records into DataFrame chunks with continuous indexes."""
+    chunk = []
+    start = 0
+    
+    for record in records:
+        chunk.append(record)
+        
+        if len(chunk) >= chunk_size:
+            yield records_to_dataframe(chunk, TRACK_COLUMNS, index=range(start, start + len(chunk)))
+            start += len(chunk)
+            chunk = []
+    
+    if chunk:
+        yield records_to_dataframe(chunk, TRACK_COLUMNS, index=range(start, start + len(chunk)))
+
+
+def _resolve_csv_columns(columns: List[str]) -> Dict[str, str]:
+    """
+    Map standard track columns to the matching CSV headers.
+    
+    Args:
+        columns: CSV header names
+        
+    Returns:
+        Dictionary mapping track columns to CSV header names
+        
+    Raises:
+        ValueError: If no track name or artist column can be found
+    """
+    lowered = {column.strip().lower(): column for column in columns}
+    resolved = {}
+    used = set()
+    
+    for track_column, aliases in CSV_COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in lowered and lowered[alias] not in used:
+                resolved[track_column] = lowered[alias]
+                used.add(lowered[alias])
+                break
+    
+    if 'track_name' not in resolved or 'artist_name' not in resolved:
+        raise ValueError(f"CSV needs track name and artist columns, found: {', '.join(columns)}")
+    
+    return resolved
+
+
+def iter_csv_tracks(path: Union[str, Path], chunk_size: int = 1000) -> Iterator[pd.DataFrame]:
+    """
+    Stream tracks from a playlist CSV (Exportify, TuneMyMusic, or this app's own exports).
+    
+    Args:
+        path: Path to the CSV file
+        chunk_size: Number of rows read per chunk
+        
+    Yields:
+        DataFrames in the standard track schema
+    """
+    start = 0
+    
+    reader = pd.read_csv(path, chunksize=chunk_size, dtype=str, keep_default_na=False)
+    for csv_chunk in reader:
+        columns = _resolve_csv_columns(list(csv_chunk.columns))
+        
+        records = [
+            _track_record(
+                row[columns['track_name']],
+                row[columns['artist_name']],
+                row.get(columns.get('album_name'), ''),
+                row.get(columns.get('spotify_url'), ''),
+                row.get(columns.get('isrc'), ''),
+                row.get(columns.get('duration_ms'))
+            )
+            for row in csv_chunk.to_dict('records')
+        ]
+        
+        yield records_to_dataframe(records, TRACK_COLUMNS, index=range(start, start + len(records)))
+        start += len(records)
+
+
+def _iter_export_records(data, playlist_name: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Yield track records from parsed Spotify account data export JSON.
+    
+    Handles Playlist*.json, YourLibrary.json and both the basic and extended
+    streaming history formats. Streaming history lists every play, so it is
+    reduced to distinct tracks.
+    
+    Args:
+        data: Parsed JSON content
+        playlist_name: Only include this playlist from a playlists export
+        
+    Yields:
+        Track records in the standard schema
+    """
+    if isinstance(data, dict) and 'playlists' in data:
+        for playlist in data['playlists']:
+            if playlist_name and playlist.get('name') != playlist_name:
+                continue
+            
+            for item in playlist.get('items', []):
+                track = item.get('track')
+                # Episodes and local files have no track entry
+                if not track:
+                    continue
+                yield _track_record(
+                    track.get('trackName'),
+                    track.get('artistName'),
+                    track.get('albumName'),
+                    track.get('trackUri')
+                )
+    
+    elif isinstance(data, dict) and 'tracks' in data:
+        for track in data['tracks']:
+            yield _track_record(track.get('track'), track.get('artist'), track.get('album'), track.get('uri'))
+    
+    elif isinstance(data, list):
+        seen = set()
+        
+        for play in data:
+            if 'master_metadata_track_name' in play:
+                record = _track_record(
+                    play.get('master_metadata_track_name'),
+                    play.get('master_metadata_album_artist_name'),
+                    play.get('master_metadata_album_album_name'),
+                    play.get('spotify_track_uri')
+                )
+            else:
+                record = _track_record(play.get('trackName'), play.get('artistName'))
+            
+            key = (record['artist_name'].lower(), record['track_name'].lower())
+            # Podcast plays have no track name
+            if record['track_name'] and key not in seen:
+                seen.add(key)
+                yield record
+    
+    else:
+        raise ValueError("Unrecognized Spotify data export format")
+
+
+def iter_export_tracks(path: Union[str, Path],
+                       chunk_size: int = 1000,
+                       playlist_name: Optional[str] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream tracks from a Spotify data export or a playlist CSV.
+    
+    CSV files are read in chunks. Export JSON files have to be parsed whole,
+    but the resulting tracks are still handed out in chunks.
+    
+    Args:
+        path: Path to a ``.csv`` or Spotify export ``.json`` file
+        chunk_size: Number of tracks per chunk
+        playlist_name: Only include this playlist from a playlists export
+        
+    Yields:
+        DataFrames with columns: track_id, track_name, artist_name, album_name,
+        spotify_url, isrc, duration_ms
+    """
+    path = Path(path)
+    
+    if path.suffix.lower() == '.csv':
+        yield from iter_csv_tracks(path, chunk_size)
+        return
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    yield from _records_to_chunks(_iter_export_records(data, playlist_name), chunk_size)
+
+
+def load_export_tracks(path: Union[str, Path], playlist_name: Optional[str] = None) -> pd.DataFrame:
+    """
+    Convenience function to load a Spotify data export or playlist CSV.
+    
+    Args:
+        path: Path to a ``.csv`` or Spotify export ``.json`` file
+        playlist_name: Only include this playlist from a playlists export
+        
+    Returns:
+        DataFrame with track data
+    """
+    chunks = list(iter_export_tracks(path, playlist_name=playlist_name))
+    
+    if not chunks:
+        return records_to_dataframe([], TRACK_COLUMNS)
+    
+    return pd.concat(chunks)
+
+
+if __name__ == "__main__":
+    import argparse
+    from services.youtube import DEFAULT_SEARCH_WORKERS, YouTubeMusicService
+    
+    parser = argparse.ArgumentParser(description="Match tracks from a Spotify export or CSV on YouTube Music")
+    parser.add_argument("path", help="Spotify export JSON or playlist CSV")
+    parser.add_argument("--playlist", help="Only convert this playlist from a playlists export")
+    parser.add_argument("--output", default="export_youtube_matches.csv", help="Output CSV path")
+    args = parser.parse_args()
+    
+    try:
+        youtube_service = YouTubeMusicService()
+        results = youtube_service.iter_search_playlist_tracks(
+            iter_export_tracks(args.path, playlist_name=args.playlist),
+            max_workers=DEFAULT_SEARCH_WORKERS
+        )
+        
+        for i, results_df in enumerate(results):
+            results_df.to_csv(args.output, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+        
+        print(f"💾 Results saved to: {args.output}")
+    except Exception as e:
+        print(f"❌ Error: {e}")
@@ -2,227 +2,1108 @@
 YouTube Music search service for finding tracks from Spotify playlists.
 """
 
+import asyncio
 import os
 import re
-from typing import List, Dict, Optional
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from contextlib import closing, contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 import pandas as pd
 from ytmusicapi import YTMusic
 from dotenv import load_dotenv
+from services.candidates import EMPTY_MATCH, MATCH_COLUMNS, CandidateStore, candidate_key, candidate_keys
+from services.scoring import DURATION_TOLERANCE_SECONDS, SCORER_VERSION, parse_durations, score_candidates
+from utils.dataframes import compact_dataframe
 from utils.image_cache import cache_image
+from utils.memo import LRUCache
+from utils.search_cache import SearchCache, get_search_cache, search_cache_key
+from utils.single_flight import SingleFlight
+from utils.text import strip_credit_tags
+
+
+# Default number of concurrent searches; each in-flight search borrows a pooled YTMusic client
+DEFAULT_SEARCH_WORKERS = 8
+
+# Default number of in-flight searches per async job, and threads shared by all
+# async jobs and threaded conversions (which cap concurrency with max_workers)
+DEFAULT_ASYNC_CONCURRENCY = 16
+ASYNC_EXECUTOR_WORKERS = 32
+
+# Confidence at which search_track stops escalating to broader searches, and that
+# album lookups and album-local track matches must reach to be used
+DEFAULT_ESCALATION_THRESHOLD = 0.7
+
+# Lower confidence that also stops escalation when the candidate's duration is
+# within DURATION_TOLERANCE_SECONDS of the Spotify track
+DURATION_AGREEMENT_CONFIDENCE = 0.6
+
+# Album search results considered when resolving an album
+ALBUM_SEARCH_LIMIT = 5
+
+# Threads shared by the raced searches of all hedged search_track calls
+HEDGE_EXECUTOR_WORKERS = 16
+
+# Defaults for the in-process memo that sits in front of the search cache
+DEFAULT_MEMO_CAPACITY = 4096
+DEFAULT_MEMO_TTL_SECONDS = 3600.0
+
+# Identical searches in flight at the same time, from any service instance, share one request
+_search_flights = SingleFlight()
 
 
 class YouTubeMusicService:
     """Service class for searching YouTube Music."""
     
-    def __init__(self):
-        """Initialize YouTube Music client."""
+    def __init__(self, use_cache: bool = True, hedge: bool = False):
+        """
+        Initialize YouTube Music client.
+        
+        Args:
+            use_cache: Serve repeated searches from the in-process memo and
+                the local search cache
+            hedge: Race the songs and videos searches for every track by default
+        """
         load_dotenv()
         
+        self.hedge = hedge
+        
+        # Every scored candidate of every searched track, for re-picks without re-searching
+        self.candidate_store = CandidateStore()
+        
+        self.search_memo: Optional[LRUCache] = get_search_memo() if use_cache else None
+        self.search_cache: Optional[SearchCache] = get_search_cache() if use_cache else None
+        
+        self.ytmusic = self._create_client()
+        
+        # YTMusic's session is not thread-safe, so each concurrent search borrows a client
+        # from this pool. Clients outlive the threads that used them, so a new client (and
+        # its visitor-id request) is only created when more searches overlap than ever before
+        self._idle_clients: List[YTMusic] = [self.ytmusic]
+        self._clients_lock = threading.Lock()
+    
+    @staticmethod
+    def _create_client() -> YTMusic:
+        """
+        Create a YouTube Music client.
+        
+        Returns:
+            YTMusic client
+            
+        Raises:
+            ValueError: If the client cannot be initialized
+        """
         # YTMusic doesn't require authentication for search
         # But you can optionally provide headers for better results
         try:
-            self.ytmusic = YTMusic()
+            return YTMusic()
         except Exception as e:
             raise ValueError(f"Failed to initialize YouTube Music client: {e}")
     
-    def search_track(self, artist: str, track_name: str, limit: int = 5) -> List[Dict]:
+    @contextmanager
+    def _client(self) -> Iterator[YTMusic]:
+        """
+        Borrow a YouTube Music client for exclusive use.
+        
+        Yields:
+            An idle pooled client, or a new one if all are in use
+        """
+        with self._clients_lock:
+            client = self._idle_clients.pop() if self._idle_clients else None
+        
+        if client is None:
+            client = self._create_client()
+        
+        try:
+            yield client
+        finally:
+            with self._clients_lock:
+                self._idle_clients.append(client)
+    
+    def search_track(self, 
+                     artist: str, 
+                     track_name: str, 
+                     limit: int = 5, 
+                     duration_ms: Optional[int] = None, 
+                     escalate: bool = True, 
+                     confidence_threshold: float = DEFAULT_ESCALATION_THRESHOLD, 
+                     hedge: Optional[bool] = None) -> List[Dict]:
         """
         Search for a track on YouTube Music.
         
+        Searches run in tiers from cheapest to broadest (see ``_search_tiers``)
+        and stop as soon as a candidate reaches ``confidence_threshold``, or
+        ``DURATION_AGREEMENT_CONFIDENCE`` with a duration matching the Spotify
+        track, so easy tracks cost a single request. In hedged mode the songs and
+        videos searches run at the same time and the first one to produce a
+        confident match wins. Searches seen before are
+        answered from the in-process memo or the search cache; the cached
+        candidates are scored again against this artist and track name.
+        
+        Args:
+            artist: Artist name
+            track_name: Track name
+            limit: Maximum number of results to return per search
+            duration_ms: Spotify track duration, used in scoring and to break confidence ties
+            escalate: Try the broader tiers when the first search isn't confident
+            confidence_threshold: Confidence at which no further tiers are tried
+            hedge: Race the songs and videos searches (defaults to the service setting)
+            
+        Returns:
+            List of search results with YouTube Music data, best match first
+        """
+        if hedge is None:
+            hedge = self.hedge
+        
+        tiers = list(self._search_tiers(artist, track_name, escalate))
+        if hedge:
+            raced = [tiers[0], (artist, track_name, "videos")]
+            rounds = [raced] + [[tier] for tier in tiers[1:] if tier not in raced]
+        else:
+            rounds = [[tier] for tier in tiers]
+        
+        processed_results = []
+        seen_video_ids = set()
+        settled = False
+        
+        for searches in rounds:
+            with closing(self._run_searches(searches, limit)) as results:
+                for candidates in results:
+                    for result in self._score_candidates(artist, track_name, candidates, duration_ms):
+                        if result['youtube_video_id'] not in seen_video_ids:
+                            seen_video_ids.add(result['youtube_video_id'])
+                            processed_results.append(result)
+                            settled = settled or self._is_settled(result, duration_ms, confidence_threshold)
+                    
+                    if settled:
+                        break
+            
+            if settled:
+                break
+        
+        return self._rank_results(processed_results, duration_ms)
+    
+    @classmethod
+    def _rank_results(cls, results: List[Dict], duration_ms: Optional[int]) -> List[Dict]:
+        """
+        Sort scored candidates best first.
+        
+        Args:
+            results: Scored candidates (sorted in place)
+            duration_ms: Spotify track duration, used to break confidence ties
+            
+        Returns:
+            The sorted candidates
+        """
+        # Sort by match confidence, preferring the closest duration among equal scores
+        results.sort(key=lambda x: (-x['match_confidence'], cls._duration_delta(x, duration_ms)))
+        return results
+    
+    @classmethod
+    def _is_settled(cls, result: Dict, duration_ms: Optional[int], confidence_threshold: float) -> bool:
+        """
+        Check whether a scored candidate is good enough to stop searching.
+        
+        Args:
+            result: Scored candidate
+            duration_ms: Spotify track duration (None if unknown)
+            confidence_threshold: Confidence at which no further tiers are tried
+            
+        Returns:
+            True if the candidate reaches the threshold, or reaches
+            ``DURATION_AGREEMENT_CONFIDENCE`` with a matching duration
+        """
+        if result['match_confidence'] >= confidence_threshold:
+            return True
+        
+        return (bool(duration_ms) 
+                and result['match_confidence'] >= DURATION_AGREEMENT_CONFIDENCE 
+                and cls._duration_delta(result, duration_ms) <= DURATION_TOLERANCE_SECONDS)
+    
+    @staticmethod
+    def _score_candidates(artist: str, 
+                          track_name: str, 
+                          candidates: List[Dict], 
+                          duration_ms: Optional[int] = None) -> List[Dict]:
+        """
+        Score candidates against a track.
+        
+        Cached candidates may come from a differently spelled query, so they
+        are always scored against the caller's artist and track name.
+        Candidates cached without ``youtube_duration_seconds`` get it parsed
+        from their display duration.
+        
+        Args:
+            artist: Artist name
+            track_name: Track name
+            candidates: List of unscored candidates
+            duration_ms: Spotify track duration (None if unknown)
+            
+        Returns:
+            Candidates with ``match_confidence`` and ``scorer_version`` added
+        """
+        durations = parse_durations(
+            candidate.get('youtube_duration') if candidate.get('youtube_duration_seconds') is None
+            else candidate['youtube_duration_seconds']
+            for candidate in candidates
+        )
+        scores = score_candidates(
+            [artist] * len(candidates),
+            [track_name] * len(candidates),
+            [candidate['youtube_title'] for candidate in candidates],
+            [candidate['youtube_artists'] for candidate in candidates],
+            [duration_ms] * len(candidates),
+            durations
+        )
+        return [
+            {
+                **candidate,
+                'youtube_duration_seconds': None if pd.isna(seconds) else int(seconds),
+                'match_confidence': float(score),
+                'scorer_version': SCORER_VERSION
+            }
+            for candidate, seconds, score in zip(candidates, durations.tolist(), scores)
+        ]
+    
+    @staticmethod
+    def _search_tiers(artist: str, track_name: str, escalate: bool = True) -> Iterator[tuple]:
+        """
+        List the searches to try for a track, cheapest and most precise first.
+        
+        1. Artist and title, songs only
+        2. Primary artist and title, songs only (when several artists are credited)
+        3. Title alone, songs only
+        4. Artist and title, all videos (covers uploads missing from the songs catalogue)
+        
         Args:
             artist: Artist name
             track_name: Track name
+            escalate: Include the tiers after the first
+            
+        Yields:
+            Tuples of (artist, title, search filter)
+        """
+        yield artist, track_name, "songs"
+        if not escalate:
+            return
+        
+        primary_artist = artist.split(', ')[0]
+        if primary_artist != artist:
+            yield primary_artist, track_name, "songs"
+        
+        yield '', track_name, "songs"
+        yield artist, track_name, "videos"
+    
+    def _run_searches(self, searches: List[tuple], limit: int) -> Iterator[List[Dict]]:
+        """
+        Run one or more searches, yielding candidates as each search finishes.
+        
+        Several searches run concurrently on the hedge executor. When the
+        caller stops iterating early, searches that haven't started are
+        cancelled; ones already running finish in the background and still
+        fill the caches.
+        
+        Args:
+            searches: Tuples of (artist, title, search filter)
+            limit: Maximum number of results to return per search
+            
+        Yields:
+            Lists of unscored candidates, in completion order
+        """
+        if len(searches) == 1:
+            yield self._search_candidates(*searches[0], limit)
+            return
+        
+        executor = get_hedge_executor()
+        futures = [executor.submit(self._search_candidates, *search, limit) for search in searches]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+    
+    def _search_candidates(self, artist: str, track_name: str, search_filter: str, limit: int) -> List[Dict]:
+        """
+        Get unscored candidates for one search, from cache when possible.
+        
+        Args:
+            artist: Artist name (may be empty for a title-only search)
+            track_name: Track name
+            search_filter: YouTube Music search filter
             limit: Maximum number of results to return
             
         Returns:
-            List of search results with YouTube Music data
+            List of unscored candidates (empty if the search failed)
         """
-        # Create search query
-        query = f"{artist} {track_name}"
+        # Featured-artist and remaster tags only add noise to the query; live tags pick the recording
+        query = ' '.join(part for part in (strip_credit_tags(artist), strip_credit_tags(track_name)) if part)
+        
+        cache_key = search_cache_key(artist, track_name, search_filter, limit)
+        candidates = self._lookup_candidates(cache_key)
+        if candidates is not None:
+            return candidates
         
         try:
-            # Search for songs on YouTube Music
-            results = self.ytmusic.search(query, filter="songs", limit=limit)
+            return _search_flights.do(cache_key, self._fetch_candidates, query, search_filter, limit, cache_key)
+        except Exception as e:
+            print(f"Error searching for '{query}': {e}")
+            return []
+    
+    def _fetch_candidates(self, query: str, search_filter: str, limit: int, cache_key: str) -> List[Dict]:
+        """
+        Search YouTube Music and cache the unscored candidates.
+        
+        Args:
+            query: Search query
+            search_filter: YouTube Music search filter
+            limit: Maximum number of results to return
+            cache_key: Key from ``search_cache_key``
             
-            processed_results = []
-            for result in results:
-                processed_result = {
-                    'youtube_title': result.get('title', ''),
-                    'youtube_artist': ', '.join([artist['name'] for artist in result.get('artists', [])]),
-                    'youtube_album': result.get('album', {}).get('name', '') if result.get('album') else '',
-                    'youtube_duration': result.get('duration', ''),
-                    'youtube_url': f"https://music.youtube.com/watch?v={result.get('videoId', '')}",
-                    'youtube_video_id': result.get('videoId', ''),
-                    'youtube_thumbnail': result.get('thumbnails', [{}])[-1].get('url', '') if result.get('thumbnails') else '',
-                    'match_confidence': self._calculate_match_confidence(artist, track_name, result)
-                }
-                processed_results.append(processed_result)
+        Returns:
+            List of unscored candidates
+        """
+        # A flight for this key may have finished between the caller's lookup and this one
+        candidates = self.search_memo.get(cache_key) if self.search_memo else None
+        if candidates is not None:
+            return candidates
+        
+        # Search YouTube Music
+        with self._client() as client:
+            results = client.search(query, filter=search_filter, limit=limit)
+        
+        candidates = [self._process_result(result) for result in results]
+        self._store_candidates(cache_key, candidates)
+        return candidates
+    
+    def _lookup_candidates(self, cache_key: str) -> Optional[List[Dict]]:
+        """
+        Look up cached candidates, checking the memo before the search cache.
+        
+        Args:
+            cache_key: Key from ``search_cache_key``
             
-            # Sort by match confidence
-            processed_results.sort(key=lambda x: x['match_confidence'], reverse=True)
-            return processed_results
+        Returns:
+            List of unscored candidates, or None if the search isn't cached
+        """
+        if self.search_memo:
+            candidates = self.search_memo.get(cache_key)
+            if candidates is not None:
+                return candidates
+        
+        if self.search_cache:
+            candidates = self.search_cache.get(cache_key)
+            if candidates is not None:
+                if self.search_memo:
+                    self.search_memo.put(cache_key, candidates)
+                return candidates
+        
+        return None
+    
+    def _store_candidates(self, cache_key: str, candidates: List[Dict]):
+        """
+        Store fresh candidates in the memo and the search cache.
+        
+        Args:
+            cache_key: Key from ``search_cache_key``
+            candidates: List of unscored candidates
+        """
+        if self.search_memo:
+            self.search_memo.put(cache_key, candidates)
+        if self.search_cache:
+            self.search_cache.put(cache_key, candidates)
+    
+    @staticmethod
+    def _process_result(result: Dict) -> Dict:
+        """
+        Convert a raw YouTube Music search result into a candidate.
+        
+        Args:
+            result: Search result from ``YTMusic.search``
+            
+        Returns:
+            Candidate dictionary with YouTube Music data, without a confidence score
+        """
+        artists = [artist['name'] for artist in result.get('artists') or []]
+        
+        return {
+            'youtube_title': result.get('title', ''),
+            'youtube_artist': ', '.join(artists),
+            'youtube_artists': artists,
+            'youtube_album': result.get('album', {}).get('name', '') if result.get('album') else '',
+            'youtube_duration': result.get('duration', ''),
+            'youtube_duration_seconds': result.get('duration_seconds'),
+            'youtube_url': f"https://music.youtube.com/watch?v={result.get('videoId', '')}",
+            'youtube_video_id': result.get('videoId', ''),
+            'youtube_thumbnail': result.get('thumbnails', [{}])[-1].get('url', '') if result.get('thumbnails') else ''
+        }
+    
+    def _album_candidates(self, album_name: str, artist: str) -> List[Dict]:
+        """
+        Get the tracks of an album on YouTube Music as unscored candidates.
+        
+        Args:
+            album_name: Album name
+            artist: Primary album artist
             
+        Returns:
+            List of unscored candidates (empty if the album wasn't found)
+        """
+        cache_key = search_cache_key(artist, album_name, "albums", ALBUM_SEARCH_LIMIT)
+        candidates = self._lookup_candidates(cache_key)
+        if candidates is not None:
+            return candidates
+        
+        try:
+            return _search_flights.do(cache_key, self._fetch_album_candidates, album_name, artist, cache_key)
         except Exception as e:
-            print(f"Error searching for '{query}': {e}")
+            print(f"Error looking up album '{artist} - {album_name}': {e}")
             return []
     
-    def _calculate_match_confidence(self, original_artist: str, original_track: str, yt_result: Dict) -> float:
+    def _fetch_album_candidates(self, album_name: str, artist: str, cache_key: str) -> List[Dict]:
         """
-        Calculate a confidence score for how well the YouTube result matches the original track.
+        Resolve an album on YouTube Music and cache its tracks as candidates.
+        
+        The album search results are scored like tracks (album title against
+        album name); the best one is only used if it reaches
+        ``DEFAULT_ESCALATION_THRESHOLD``.
+        
+        Args:
+            album_name: Album name
+            artist: Primary album artist
+            cache_key: Key from ``search_cache_key``
+            
+        Returns:
+            List of unscored candidates (empty if the album wasn't found)
+        """
+        # A flight for this key may have finished between the caller's lookup and this one
+        candidates = self.search_memo.get(cache_key) if self.search_memo else None
+        if candidates is not None:
+            return candidates
+        
+        query = ' '.join(part for part in (strip_credit_tags(artist), strip_credit_tags(album_name)) if part)
+        
+        album = None
+        with self._client() as client:
+            albums = [album for album in client.search(query, filter="albums", limit=ALBUM_SEARCH_LIMIT) if album.get('browseId')]
+            
+            if albums:
+                scores = score_candidates(
+                    [artist] * len(albums),
+                    [album_name] * len(albums),
+                    [album.get('title', '') for album in albums],
+                    [[album_artist['name'] for album_artist in album.get('artists') or []] for album in albums]
+                )
+                best = int(scores.argmax())
+                
+                if scores[best] >= DEFAULT_ESCALATION_THRESHOLD:
+                    album = client.get_album(albums[best]['browseId'])
+        
+        candidates = []
+        if album:
+            candidates = [
+                # Album tracks carry the album as a plain title and usually no thumbnails of their own
+                self._process_result({
+                    **track,
+                    'album': {'name': album.get('title', '')},
+                    'thumbnails': track.get('thumbnails') or album.get('thumbnails')
+                })
+                for track in album.get('tracks', [])
+                if track.get('videoId')
+            ]
+        
+        self._store_candidates(cache_key, candidates)
+        return candidates
+    
+    def _match_albums(self, rows: List[pd.Series], max_workers: int = 1, min_tracks: int = 2) -> Dict[int, Dict]:
+        """
+        Match tracks against the track lists of their albums.
+        
+        Rows are grouped by album name and primary artist. Every album with at
+        least ``min_tracks`` rows is resolved once, and its members are matched
+        locally against the album's track list. Members without a confident
+        match are left for a regular search.
+        
+        Args:
+            rows: Rows with Spotify track data
+            max_workers: Number of concurrent album lookups
+            min_tracks: Minimum number of rows from one album to look it up
+            
+        Returns:
+            Dictionary mapping row positions to combined result dictionaries
+        """
+        if not rows:
+            return {}
+        
+        albums_df = pd.DataFrame({
+            'album_name': [row['album_name'] for row in rows],
+            'primary_artist': [str(row['artist_name']).split(', ')[0] for row in rows]
+        })
+        groups = [
+            (album_name, artist, positions)
+            for (album_name, artist), positions in albums_df.groupby(
+                ['album_name', 'primary_artist'], observed=True, sort=False
+            ).indices.items()
+            if album_name and len(positions) >= min_tracks
+        ]
+        if not groups:
+            return {}
+        
+        print(f"Looking up {len(groups)} albums for {sum(len(group[2]) for group in groups)} tracks")
+        
+        lookups = [(album_name, artist) for album_name, artist, _ in groups]
+        if max_workers <= 1:
+            album_candidates = [self._album_candidates(*lookup) for lookup in lookups]
+        else:
+            album_candidates = _bounded_map(lambda lookup: self._album_candidates(*lookup), lookups, max_workers)
+        
+        matched = {}
+        for (_, _, positions), candidates in zip(groups, album_candidates):
+            if not candidates:
+                continue
+            
+            for position in positions:
+                row = rows[position]
+                duration_ms = row.get('duration_ms')
+                duration_ms = None if pd.isna(duration_ms) else int(duration_ms)
+                results = self._rank_results(
+                    self._score_candidates(row['artist_name'], row['track_name'], candidates, duration_ms),
+                    duration_ms
+                )
+                if results[0]['match_confidence'] >= DEFAULT_ESCALATION_THRESHOLD:
+                    matched[int(position)] = self._combine_row(row, results)
+        
+        print(f"Matched {len(matched)} tracks from album track lists")
+        return matched
+    
+    async def search_track_async(self, 
+                                 artist: str, 
+                                 track_name: str, 
+                                 limit: int = 5, 
+                                 duration_ms: Optional[int] = None) -> List[Dict]:
+        """
+        Search for a track on YouTube Music without blocking the event loop.
+        
+        The blocking ``search_track`` call runs on the shared search executor.
+        
+        Args:
+            artist: Artist name
+            track_name: Track name
+            limit: Maximum number of results to return
+            duration_ms: Spotify track duration, used to break confidence ties
+            
+        Returns:
+            List of search results with YouTube Music data
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_search_executor(), self.search_track, artist, track_name, limit, duration_ms
+        )
+    
+    @staticmethod
+    def _duration_delta(candidate: Dict, duration_ms: Optional[int]) -> float:
+        """
+        Get the difference between a candidate's duration and the Spotify duration.
+        
+        Args:
+            candidate: Processed YouTube Music search result
+            duration_ms: Spotify track duration in milliseconds (None if unknown)
+            
+        Returns:
+            Absolute difference in seconds (0 if the Spotify duration is unknown,
+            infinity if only the candidate's duration is unknown)
+        """
+        if not duration_ms:
+            return 0.0
+        
+        duration_seconds = candidate.get('youtube_duration_seconds')
+        if duration_seconds is None:
+            return float('inf')
+        
+        return abs(duration_seconds - duration_ms / 1000)
+    
+    def _calculate_match_confidence(self, 
+                                    original_artist: str, 
+                                    original_track: str, 
+                                    yt_result: Dict, 
+                                    duration_ms: Optional[int] = None) -> float:
+        """
+        Calculate a confidence score for how well one raw YouTube Music search
+        result matches the original track.
+        
+        A single-candidate call of ``services.scoring.score_candidates``,
+        which holds the scoring rules.
         
         Args:
             original_artist: Original artist name
             original_track: Original track name
             yt_result: YouTube Music search result
+            duration_ms: Spotify track duration (None if unknown)
             
         Returns:
             Confidence score between 0 and 1
         """
-        score = 0.0
+        yt_duration = yt_result.get('duration_seconds')
+        if yt_duration is None:
+            yt_duration = yt_result.get('duration')
         
-        yt_title = yt_result.get('title', '').lower()
-        yt_artists = [artist['name'].lower() for artist in yt_result.get('artists', [])]
+        scores = score_candidates(
+            [original_artist],
+            [original_track],
+            [yt_result.get('title', '')],
+            [[artist['name'] for artist in yt_result.get('artists', [])]],
+            [duration_ms],
+            [yt_duration]
+        )
+        return float(scores[0])
+    
+    def _search_row(self, row: pd.Series, top_results: int) -> Dict:
+        """
+        Search YouTube Music for a single Spotify track row.
         
-        original_artist_lower = original_artist.lower()
-        original_track_lower = original_track.lower()
+        Args:
+            row: Row with Spotify track data
+            top_results: Number of top YouTube results to consider
+            
+        Returns:
+            Dictionary combining the Spotify data with the best YouTube match
+        """
+        duration_ms = row.get('duration_ms')
         
-        # Check if track name matches (50% weight)
-        if original_track_lower in yt_title:
-            score += 0.5
-        elif any(word in yt_title for word in original_track_lower.split() if len(word) > 2):
-            score += 0.3
+        # Search YouTube Music
+        yt_results = self.search_track(
+            row['artist_name'], 
+            row['track_name'], 
+            limit=top_results,
+            duration_ms=None if pd.isna(duration_ms) else int(duration_ms)
+        )
         
-        # Check if artist matches (40% weight)
-        artist_match = False
-        for yt_artist in yt_artists:
-            if original_artist_lower in yt_artist or yt_artist in original_artist_lower:
-                score += 0.4
-                artist_match = True
-                break
+        return self._combine_row(row, yt_results)
+    
+    def _combine_row(self, row: pd.Series, yt_results: List[Dict]) -> Dict:
+        """
+        Combine a Spotify track row with its ranked YouTube Music candidates.
         
-        if not artist_match:
-            # Check for partial artist matches
-            for yt_artist in yt_artists:
-                artist_words = original_artist_lower.split()
-                if any(word in yt_artist for word in artist_words if len(word) > 2):
-                    score += 0.2
-                    break
+        All candidates are kept in ``self.candidate_store``.
         
-        # Bonus for exact matches (10% weight)
-        if (original_track_lower == yt_title and 
-            any(original_artist_lower == yt_artist for yt_artist in yt_artists)):
-            score += 0.1
+        Args:
+            row: Row with Spotify track data
+            yt_results: Scored candidates, best first
+            
+        Returns:
+            Dictionary combining the Spotify data with the best YouTube match
+        """
+        # Original Spotify data
+        combined = {
+            'track_id': row.get('track_id', ''),
+            'track_name': row['track_name'],
+            'artist_name': row['artist_name'],
+            'album_name': row['album_name'],
+            'spotify_url': row['spotify_url'],
+            'isrc': row.get('isrc', ''),
+            'duration_ms': row.get('duration_ms')
+        }
+        
+        if yt_results:
+            # Take the best match
+            best_match = yt_results[0]
+            
+            # Cache the thumbnail image
+            thumbnail_url = best_match['youtube_thumbnail']
+            best_match['youtube_thumbnail_local'] = None
+            if thumbnail_url:
+                print(f"Caching thumbnail for: {best_match['youtube_title']}")
+                best_match['youtube_thumbnail_local'] = cache_image(thumbnail_url)
+            
+            # Combine Spotify and YouTube data
+            combined.update({column: best_match[column] for column in MATCH_COLUMNS})
+        else:
+            # No YouTube results found
+            combined.update(EMPTY_MATCH)
         
-        return min(score, 1.0)
+        self.candidate_store.add(candidate_key(row['artist_name'], row['track_name'], row.get('track_id')), yt_results)
+        return combined
     
-    def search_playlist_tracks(self, spotify_df: pd.DataFrame, top_results: int = 3) -> pd.DataFrame:
+    def search_playlist_tracks(self, 
+                               spotify_df: pd.DataFrame, 
+                               top_results: int = 3, 
+                               max_workers: int = 1, 
+                               progress_callback: Optional[Callable[[int, int], None]] = None, 
+                               by_album: bool = False) -> pd.DataFrame:
         """
         Search YouTube Music for all tracks in a Spotify playlist DataFrame.
         
+        With ``max_workers`` above 1 the searches run on the shared search
+        executor, each borrowing a pooled YTMusic client. With ``by_album``, tracks sharing
+        an album are first matched against the album's track list (see
+        ``_match_albums``) and only the rest are searched one by one. Output
+        rows always follow the order of ``spotify_df``.
+        
         Args:
             spotify_df: DataFrame with Spotify track data
             top_results: Number of top YouTube results to keep per track
+            max_workers: Number of concurrent searches (1 searches sequentially)
+            progress_callback: Called as ``progress_callback(completed, total)``
+                on the calling thread after each track is searched
+            by_album: Match tracks from the same album via one album lookup
             
         Returns:
             DataFrame with combined Spotify and YouTube Music data
         """
-        all_results = []
+        results = next(self._search_chunks([spotify_df], top_results, max_workers, progress_callback, by_album))
+        return compact_dataframe(pd.DataFrame(results))
+    
+    def iter_search_playlist_tracks(self, 
+                                    spotify_chunks: Iterable[pd.DataFrame], 
+                                    top_results: int = 3, 
+                                    max_workers: int = 1, 
+                                    progress_callback: Optional[Callable[[int, int], None]] = None, 
+                                    by_album: bool = False) -> Iterator[pd.DataFrame]:
+        """
+        Search YouTube Music chunk by chunk as Spotify tracks arrive.
+        
+        Designed to consume ``SpotifyService.iter_playlist_track_chunks`` so
+        searching starts with the first page instead of after the last one.
+        Concurrent searches run across chunk boundaries: the next chunk is
+        pulled in as soon as the current one has no searches left to start,
+        so workers don't idle while a chunk's slowest search finishes.
         
-        for idx, row in spotify_df.iterrows():
-            print(f"Searching {idx + 1}/{len(spotify_df)}: {row['artist_name']} - {row['track_name']}")
+        Args:
+            spotify_chunks: Iterable of DataFrames with Spotify track data
+            top_results: Number of top YouTube results to keep per track
+            max_workers: Number of concurrent searches
+            progress_callback: Called as ``progress_callback(completed, total)``
+                with the running count of searched tracks and the number of
+                tracks received so far
+            by_album: Match tracks from the same album within a chunk via one album lookup
             
-            # Search YouTube Music
-            yt_results = self.search_track(
-                row['artist_name'], 
-                row['track_name'], 
-                limit=top_results
-            )
+        Yields:
+            DataFrames with combined Spotify and YouTube Music data, indexed
+            like the chunk they were built from
+        """
+        # Keep each chunk's index to label its results
+        indexes = deque()
+        
+        def remember_index(chunks):
+            for chunk in chunks:
+                indexes.append(chunk.index)
+                yield chunk
+        
+        for results in self._search_chunks(remember_index(spotify_chunks), top_results, max_workers, progress_callback, by_album):
+            results_df = compact_dataframe(pd.DataFrame(results))
+            results_df.index = indexes.popleft()
+            yield results_df
+    
+    def _start_chunk(self, chunk: pd.DataFrame, max_workers: int, by_album: bool) -> Dict:
+        """
+        Prepare a chunk for searching, matching album tracks first when asked.
+        
+        Args:
+            chunk: DataFrame with Spotify track data
+            max_workers: Number of concurrent album lookups
+            by_album: Match tracks from the same album via one album lookup
             
-            if yt_results:
-                # Take the best match
-                best_match = yt_results[0]
+        Returns:
+            Dictionary with the chunk's rows, a result slot per row (filled for
+            album matches) and the positions still to search
+        """
+        rows = [row for _, row in chunk.iterrows()]
+        results = [None] * len(rows)
+        
+        if by_album:
+            for index, result in self._match_albums(rows, max_workers).items():
+                results[index] = result
+        
+        pending = [index for index in range(len(rows)) if results[index] is None]
+        return {'rows': rows, 'results': results, 'pending': pending, 'remaining': len(pending)}
+    
+    def _search_chunks(self, 
+                       spotify_chunks: Iterable[pd.DataFrame], 
+                       top_results: int, 
+                       max_workers: int, 
+                       progress_callback: Optional[Callable[[int, int], None]], 
+                       by_album: bool) -> Iterator[List[Dict]]:
+        """
+        Search chunks of tracks, yielding each chunk's results once all are in.
+        
+        With ``max_workers`` above 1, up to that many searches run at once on
+        the shared search executor. The window spans chunks, and later chunks
+        are pulled in while earlier ones finish. Chunks are still yielded in
+        order.
+        
+        Args:
+            spotify_chunks: Iterable of DataFrames with Spotify track data
+            top_results: Number of top YouTube results to keep per track
+            max_workers: Number of concurrent searches (1 searches sequentially)
+            progress_callback: Called as ``progress_callback(completed, received)``
+                on the calling thread
+            by_album: Match tracks from the same album within a chunk via one album lookup
+            
+        Yields:
+            Lists of combined result dictionaries, one list per chunk in row order
+        """
+        completed = 0
+        received = 0
+        
+        if max_workers <= 1:
+            for chunk in spotify_chunks:
+                state = self._start_chunk(chunk, max_workers, by_album)
+                received += len(state['rows'])
+                completed += len(state['rows']) - len(state['pending'])
+                if completed and progress_callback:
+                    progress_callback(completed, received)
                 
-                # Cache the thumbnail image
-                thumbnail_url = best_match['youtube_thumbnail']
-                cached_thumbnail_path = None
-                if thumbnail_url:
-                    print(f"Caching thumbnail for: {best_match['youtube_title']}")
-                    cached_thumbnail_path = cache_image(thumbnail_url)
+                for index in state['pending']:
+                    row = state['rows'][index]
+                    completed += 1
+                    print(f"Searching {completed}/{received}: {row['artist_name']} - {row['track_name']}")
+                    state['results'][index] = self._search_row(row, top_results)
+                    if progress_callback:
+                        progress_callback(completed, received)
                 
-                # Combine Spotify and YouTube data
-                combined_result = {
-                    # Original Spotify data
-                    'track_name': row['track_name'],
-                    'artist_name': row['artist_name'],
-                    'album_name': row['album_name'],
-                    'spotify_url': row['spotify_url'],
+                yield state['results']
+            return
+        
+        executor = get_search_executor()
+        chunks = iter(spotify_chunks)
+        states = deque()
+        queued = deque()
+        in_flight = {}
+        exhausted = False
+        
+        try:
+            while True:
+                # Fill the window, pulling in the next chunk once every queued row has started
+                while len(in_flight) < max_workers:
+                    if not queued:
+                        chunk = None if exhausted else next(chunks, None)
+                        if chunk is None:
+                            exhausted = True
+                            break
+                        
+                        state = self._start_chunk(chunk, max_workers, by_album)
+                        states.append(state)
+                        queued.extend((state, index) for index in state['pending'])
+                        received += len(state['rows'])
+                        matched = len(state['rows']) - len(state['pending'])
+                        completed += matched
+                        if matched and progress_callback:
+                            progress_callback(completed, received)
+                        continue
                     
-                    # YouTube Music data
-                    'youtube_title': best_match['youtube_title'],
-                    'youtube_artist': best_match['youtube_artist'],
-                    'youtube_album': best_match['youtube_album'],
-                    'youtube_duration': best_match['youtube_duration'],
-                    'youtube_url': best_match['youtube_url'],
-                    'youtube_video_id': best_match['youtube_video_id'],
-                    'youtube_thumbnail': best_match['youtube_thumbnail'],
-                    'youtube_thumbnail_local': cached_thumbnail_path,
-                    'match_confidence': best_match['match_confidence']
-                }
+                    state, index = queued.popleft()
+                    in_flight[executor.submit(self._search_row, state['rows'][index], top_results)] = (state, index)
                 
-                all_results.append(combined_result)
-            else:
-                # No YouTube results found
-                combined_result = {
-                    # Original Spotify data
-                    'track_name': row['track_name'],
-                    'artist_name': row['artist_name'],
-                    'album_name': row['album_name'],
-                    'spotify_url': row['spotify_url'],
-                    
-                    # Empty YouTube data
-                    'youtube_title': '',
-                    'youtube_artist': '',
-                    'youtube_album': '',
-                    'youtube_duration': '',
-                    'youtube_url': '',
-                    'youtube_video_id': '',
-                    'youtube_thumbnail': '',
-                    'youtube_thumbnail_local': None,
-                    'match_confidence': 0.0
-                }
+                while states and states[0]['remaining'] == 0:
+                    yield states.popleft()['results']
+                
+                if not in_flight:
+                    break
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    state, index = in_flight.pop(future)
+                    state['results'][index] = future.result()
+                    state['remaining'] -= 1
+                    completed += 1
+                    row = state['rows'][index]
+                    print(f"Searched {completed}/{received}: {row['artist_name']} - {row['track_name']}")
+                    if progress_callback:
+                        progress_callback(completed, received)
+        finally:
+            # Searches not yet started are dropped when the caller stops early
+            for future in in_flight:
+                future.cancel()
+    
+    async def search_playlist_tracks_async(self, 
+                                           spotify_df: pd.DataFrame, 
+                                           top_results: int = 3, 
+                                           max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY, 
+                                           progress_callback: Optional[Callable[[int, int], None]] = None) -> pd.DataFrame:
+        """
+        Search YouTube Music for all tracks in a DataFrame from async code.
+        
+        At most ``max_concurrency`` searches of this call are in flight at
+        once. The searches run on the shared search executor, so many
+        concurrent jobs share one bounded set of threads. Output rows follow
+        the order of ``spotify_df``.
+        
+        Args:
+            spotify_df: DataFrame with Spotify track data
+            top_results: Number of top YouTube results to keep per track
+            max_concurrency: Maximum number of in-flight searches for this call
+            progress_callback: Called as ``progress_callback(completed, total)``
+                on the event loop after each track is searched
                 
-                all_results.append(combined_result)
+        Returns:
+            DataFrame with combined Spotify and YouTube Music data
+        """
+        loop = asyncio.get_running_loop()
+        executor = get_search_executor()
+        semaphore = asyncio.Semaphore(max_concurrency)
         
-        return pd.DataFrame(all_results)
+        rows = [row for _, row in spotify_df.iterrows()]
+        total = len(rows)
+        completed = 0
+        
+        async def search_row(row: pd.Series) -> Dict:
+            nonlocal completed
+            async with semaphore:
+                result = await loop.run_in_executor(executor, self._search_row, row, top_results)
+            
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total)
+            return result
+        
+        all_results = await asyncio.gather(*(search_row(row) for row in rows))
+        return compact_dataframe(pd.DataFrame(all_results))
     
-    def get_best_matches(self, spotify_df: pd.DataFrame, confidence_threshold: float = 0.7) -> pd.DataFrame:
+    def get_best_matches(self, 
+                         spotify_df: pd.DataFrame, 
+                         confidence_threshold: float = 0.7, 
+                         top_results: int = 3) -> pd.DataFrame:
         """
         Get only high-confidence YouTube Music matches for Spotify tracks.
         
+        Tracks already searched by this service are answered from the
+        candidate store, honouring manual re-picks; only the rest are searched.
+        
         Args:
             spotify_df: DataFrame with Spotify track data
             confidence_threshold: Minimum confidence score to include
+            top_results: Number of top YouTube results to consider for new searches
             
         Returns:
             DataFrame with only high-confidence matches
         """
-        full_results = self.search_playlist_tracks(spotify_df)
-        return full_results[full_results['match_confidence'] >= confidence_threshold]
+        unsearched = [key not in self.candidate_store for key in candidate_keys(spotify_df)]
+        if any(unsearched):
+            self.search_playlist_tracks(spotify_df[unsearched], top_results, max_workers=DEFAULT_SEARCH_WORKERS)
+        
+        return self.candidate_store.results(spotify_df, confidence_threshold)
 
 
-def search_youtube_music(spotify_df: pd.DataFrame, top_results: int = 3) -> pd.DataFrame:
+def search_youtube_music(spotify_df: pd.DataFrame, 
+                         top_results: int = 3, 
+                         max_workers: int = DEFAULT_SEARCH_WORKERS) -> pd.DataFrame:
     """
     Convenience function to search YouTube Music for Spotify tracks.
     
     Args:
         spotify_df: DataFrame with Spotify track data
         top_results: Number of top results per track
+        max_workers: Number of concurrent searches
+        
+    Returns:
+        DataFrame with combined Spotify and YouTube Music data
+    """
+    service = YouTubeMusicService()
+    return service.search_playlist_tracks(spotify_df, top_results, max_workers=max_workers)
+
+
+async def search_youtube_music_async(spotify_df: pd.DataFrame, 
+                                     top_results: int = 3, 
+                                     max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY) -> pd.DataFrame:
+    """
+    Convenience coroutine to search YouTube Music for Spotify tracks.
+    
+    Args:
+        spotify_df: DataFrame with Spotify track data
+        top_results: Number of top results per track
+        max_concurrency: Maximum number of in-flight searches
         
     Returns:
         DataFrame with combined Spotify and YouTube Music data
     """
     service = YouTubeMusicService()
-    return service.search_playlist_tracks(spotify_df, top_results)
+    return await service.search_playlist_tracks_async(spotify_df, top_results, max_concurrency=max_concurrency)
+
+
+# Global search memo, shared by every service instance (and Streamlit rerun) in the process
+_search_memo = None
+_search_memo_lock = threading.Lock()
+
+def get_search_memo() -> LRUCache:
+    """Get the global in-process search memo."""
+    global _search_memo
+    with _search_memo_lock:
+        if _search_memo is None:
+            _search_memo = LRUCache(
+                capacity=int(os.getenv('YTMUSIC_SEARCH_MEMO_SIZE', DEFAULT_MEMO_CAPACITY)),
+                ttl_seconds=float(os.getenv('YTMUSIC_SEARCH_MEMO_TTL_SECONDS', DEFAULT_MEMO_TTL_SECONDS))
+            )
+        return _search_memo
+
+
+# Global executor for async and threaded searches
+_search_executor = None
+_search_executor_lock = threading.Lock()
+
+def get_search_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool that runs blocking searches.
+    
+    One long-lived pool is shared by every event loop, job and threaded
+    conversion in the process, so the number of search threads stays fixed
+    and no threads are started per call or per chunk.
+    """
+    global _search_executor
+    with _search_executor_lock:
+        if _search_executor is None:
+            _search_executor = ThreadPoolExecutor(
+                max_workers=ASYNC_EXECUTOR_WORKERS,
+                thread_name_prefix="ytmusic-search"
+            )
+        return _search_executor
+
+
+def _bounded_map(function: Callable, items: List, max_workers: int) -> List:
+    """
+    Apply a function to items on the shared search executor, at most
+    ``max_workers`` at a time.
+    
+    Args:
+        function: Function of one item
+        items: Items to process
+        max_workers: Maximum number of concurrent calls
+        
+    Returns:
+        Results in item order
+    """
+    executor = get_search_executor()
+    results = [None] * len(items)
+    futures = {}
+    position = 0
+    
+    while position < len(items) or futures:
+        while position < len(items) and len(futures) < max_workers:
+            futures[executor.submit(function, items[position])] = position
+            position += 1
+        
+        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+        for future in done:
+            results[futures.pop(future)] = future.result()
+    
+    return results
+
+
+# Global executor for hedged searches; separate from the async executor so a search
+# running there can hedge without waiting on its own pool
+_hedge_executor = None
+_hedge_executor_lock = threading.Lock()
+
+def get_hedge_executor() -> ThreadPoolExecutor:
+    """Get the thread pool that runs the raced searches of hedged mode."""
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(
+                max_workers=HEDGE_EXECUTOR_WORKERS,
+                thread_name_prefix="ytmusic-hedge"
+            )
+        return _hedge_executor
 
 
 if __name__ == "__main__":
@@ -259,7 +1140,7 @@ if __name__ == "__main__":
         # Save results
         combined_df.to_csv('spotify_youtube_matches.csv', index=False)
         print(f"\n💾 Results saved to: spotify_youtube_matches.csv")
-        
+    
     except Exception as e:
         print(f"❌ Error: {e}")
         print("\nMake sure you have:")
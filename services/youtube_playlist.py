@@ -178,6 +178,20 @@ class YouTubePlaylistService:
         Returns:
             True if successful
         """
+        return self.insert_playlist_item(playlist_id, video_id) is not None
+    
+    def insert_playlist_item(self, playlist_id: str, video_id: str, position: Optional[int] = None) -> Optional[str]:
+        """
+        Insert a video into a playlist, optionally at a given position.
+        
+        Args:
+            playlist_id: YouTube playlist ID
+            video_id: YouTube video ID
+            position: Zero-based position in the playlist (appends if None)
+            
+        Returns:
+            Playlist item ID if successful, None if failed
+        """
         if not self.is_authenticated():
             raise ValueError("Not authenticated. Please authenticate first.")
         
@@ -191,16 +205,77 @@ class YouTubePlaylistService:
                     }
                 }
             }
+            if position is not None:
+                playlist_item_body['snippet']['position'] = position
             
-            self.youtube.playlistItems().insert(
+            response = self.youtube.playlistItems().insert(
                 part='snippet',
                 body=playlist_item_body
             ).execute()
             
-            return True
+            return response['id']
             
         except HttpError as e:
             print(f"Error adding video {video_id} to playlist: {e}")
+            return None
+    
+    def move_playlist_item(self, playlist_id: str, playlist_item_id: str, video_id: str, position: int) -> bool:
+        """
+        Move an existing playlist item to a new position.
+        
+        Args:
+            playlist_id: YouTube playlist ID
+            playlist_item_id: ID of the playlist item to move
+            video_id: YouTube video ID of the item
+            position: Zero-based target position
+            
+        Returns:
+            True if successful
+        """
+        if not self.is_authenticated():
+            raise ValueError("Not authenticated. Please authenticate first.")
+        
+        try:
+            self.youtube.playlistItems().update(
+                part='snippet',
+                body={
+                    'id': playlist_item_id,
+                    'snippet': {
+                        'playlistId': playlist_id,
+                        'resourceId': {
+                            'kind': 'youtube#video',
+                            'videoId': video_id
+                        },
+                        'position': position
+                    }
+                }
+            ).execute()
+            
+            return True
+            
+        except HttpError as e:
+            print(f"Error moving playlist item {playlist_item_id}: {e}")
+            return False
+    
+    def delete_playlist_item(self, playlist_item_id: str) -> bool:
+        """
+        Remove an item from a playlist.
+        
+        Args:
+            playlist_item_id: ID of the playlist item to remove
+            
+        Returns:
+            True if successful
+        """
+        if not self.is_authenticated():
+            raise ValueError("Not authenticated. Please authenticate first.")
+        
+        try:
+            self.youtube.playlistItems().delete(id=playlist_item_id).execute()
+            return True
+            
+        except HttpError as e:
+            print(f"Error removing playlist item {playlist_item_id}: {e}")
             return False
     
     def create_playlist_from_tracks(self, 
@@ -9,9 +9,11 @@ import time
 from typing import Optional
 
 # Import our services
-from services.spotify import SpotifyService, extract_playlist_data
-from services.youtube import YouTubeMusicService, search_youtube_music
+from services.spotify import PAGE_SIZE, SpotifyService, extract_playlist_data
+from services.youtube import DEFAULT_SEARCH_WORKERS, YouTubeMusicService, search_youtube_music
 from services.youtube_playlist import create_youtube_playlist_streamlit
+from services.candidates import candidate_key
+from utils.dataframes import compact_dataframe, memory_report
 
 # Page configuration
 st.set_page_config(
@@ -31,6 +33,8 @@ def main():
         st.session_state.playlist_info = None
     if 'spotify_df' not in st.session_state:
         st.session_state.spotify_df = None
+    if 'candidate_store' not in st.session_state:
+        st.session_state.candidate_store = None
     if 'active_tab' not in st.session_state:
         st.session_state.active_tab = 0
     if 'pending_playlist_creation' not in st.session_state:
@@ -63,6 +67,24 @@ def main():
             index=0,
             help="Number of YouTube Music results to consider per track"
         )
+        search_workers = st.slider(
+            "Concurrent searches",
+            min_value=1,
+            max_value=16,
+            value=DEFAULT_SEARCH_WORKERS,
+            help="Number of YouTube Music searches to run in parallel"
+        )
+        hedged_search = st.checkbox(
+            "Race songs and videos searches",
+            value=False,
+            help="Search the songs and videos catalogues at the same time and keep the first confident match; "
+                 "finds live recordings and covers without adding latency, at the cost of more requests"
+        )
+        album_matching = st.checkbox(
+            "Match whole albums at once",
+            value=True,
+            help="Look up albums with several tracks in the playlist once and match their tracks locally"
+        )
         
         # Display options
         st.subheader("🖼️ Display Options")
@@ -90,7 +112,7 @@ def main():
             placeholder="https://open.spotify.com/playlist/...",
             help="Paste the URL of a public Spotify playlist"
         )
-        
+    
     with col2:
         # Quick stats (will be populated after extraction)
         st.subheader("📊 Quick Stats")
@@ -128,6 +150,7 @@ def main():
                 st.session_state.search_results = None
                 st.session_state.playlist_info = None
                 st.session_state.spotify_df = None
+                st.session_state.candidate_store = None
                 st.rerun()
         
         # Calculate and display stats
@@ -163,12 +186,13 @@ def main():
                 # Get playlist info
                 playlist_info = spotify_service.get_playlist_info(playlist_url)
                 
-                # Get track data
-                spotify_df = spotify_service.get_playlist_tracks(playlist_url)
-            
-            # Store in session state
-            st.session_state.playlist_info = playlist_info
-            st.session_state.spotify_df = spotify_df
+                # Stream track data page by page; multi-page playlists are fetched concurrently
+                # and unchanged playlist snapshots are served from the local cache
+                spotify_chunks = spotify_service.iter_playlist_track_chunks(
+                    playlist_url,
+                    concurrent=playlist_info['track_count'] > PAGE_SIZE,
+                    snapshot_id=playlist_info['snapshot_id']
+                )
             
             # Display playlist info
             st.success(f"✅ Found playlist: **{playlist_info['name']}**")
@@ -179,51 +203,90 @@ def main():
             with col2:
                 st.metric("Total Tracks", playlist_info['track_count'])
             with col3:
-                st.metric("Extracted", len(spotify_df))
+                extracted_placeholder = st.empty()
+                extracted_placeholder.metric("Extracted", "—")
             with col4:
                 if playlist_info['description']:
                     st.metric("Has Description", "Yes")
                 else:
                     st.metric("Has Description", "No")
             
-            # Step 2: YouTube Music search (if enabled)
-            if search_enabled and len(spotify_df) > 0:
-                with st.spinner(f"🔍 Searching YouTube Music for {len(spotify_df)} tracks..."):
+            # Step 2: YouTube Music search (if enabled), pipelined with Spotify paging
+            spotify_parts = []
+            result_parts = []
+            
+            if search_enabled and playlist_info['track_count'] > 0:
+                with st.spinner(f"🔍 Searching YouTube Music for {playlist_info['track_count']} tracks..."):
                     # Create YouTube service
-                    youtube_service = YouTubeMusicService()
-                    
-                    # Use the service method that includes caching
-                    combined_df = youtube_service.search_playlist_tracks(spotify_df, top_results=max_results_per_track)
-                    
-                    # Store results in session state
-                    st.session_state.search_results = combined_df
+                    youtube_service = YouTubeMusicService(hedge=hedged_search)
+                    progress_bar = st.progress(0.0)
                     
-                    # Calculate stats
-                    total_tracks = len(combined_df)
-                    youtube_matches = len(combined_df[combined_df['youtube_url'] != ''])
-                    high_confidence = len(combined_df[combined_df['match_confidence'] >= confidence_threshold])
-                    success_rate = (youtube_matches / total_tracks * 100) if total_tracks > 0 else 0
+                    def collect_chunks(chunks):
+                        for chunk in chunks:
+                            spotify_parts.append(chunk)
+                            yield chunk
                     
-                    # Update stats
-                    with stats_placeholder.container():
-                        col_a, col_b = st.columns(2)
-                        with col_a:
-                            st.metric("Tracks", total_tracks)
-                            st.metric("YouTube Matches", youtube_matches)
-                        with col_b:
-                            st.metric("High Confidence", high_confidence)
-                            st.metric("Success Rate", f"{success_rate:.1f}%")
+                    def update_progress(searched, _received):
+                        progress_bar.progress(
+                            min(searched / playlist_info['track_count'], 1.0),
+                            text=f"Searched {searched}/{playlist_info['track_count']} tracks"
+                        )
                     
-                    st.success(f"🎯 Found YouTube Music matches for {youtube_matches}/{total_tracks} tracks")
-                    
-                    # Display results
-                    display_results(combined_df, confidence_threshold, show_thumbnails, include_thumbnails_export, playlist_info)
+                    # Each Spotify page is searched as soon as it arrives, several tracks at a time
+                    for results_chunk in youtube_service.iter_search_playlist_tracks(
+                        collect_chunks(spotify_chunks),
+                        top_results=max_results_per_track,
+                        max_workers=search_workers,
+                        progress_callback=update_progress,
+                        by_album=album_matching
+                    ):
+                        result_parts.append(results_chunk)
                     
+                    progress_bar.empty()
+            else:
+                spotify_parts = list(spotify_chunks)
+            
+            # Chunks have their own categories, so re-compact after concatenating
+            spotify_df = compact_dataframe(pd.concat(spotify_parts)) if spotify_parts else pd.DataFrame()
+            extracted_placeholder.metric("Extracted", len(spotify_df))
+            
+            # Store in session state
+            st.session_state.playlist_info = playlist_info
+            st.session_state.spotify_df = spotify_df
+            
+            if result_parts:
+                combined_df = compact_dataframe(pd.concat(result_parts))
+                
+                # Store results in session state; the candidate store allows re-picks without searching
+                st.session_state.search_results = combined_df
+                st.session_state.candidate_store = youtube_service.candidate_store
+                
+                # Calculate stats
+                total_tracks = len(combined_df)
+                youtube_matches = len(combined_df[combined_df['youtube_url'] != ''])
+                high_confidence = len(combined_df[combined_df['match_confidence'] >= confidence_threshold])
+                success_rate = (youtube_matches / total_tracks * 100) if total_tracks > 0 else 0
+                
+                # Update stats
+                with stats_placeholder.container():
+                    col_a, col_b = st.columns(2)
+                    with col_a:
+                        st.metric("Tracks", total_tracks)
+                        st.metric("YouTube Matches", youtube_matches)
+                    with col_b:
+                        st.metric("High Confidence", high_confidence)
+                        st.metric("Success Rate", f"{success_rate:.1f}%")
+                
+                st.success(f"🎯 Found YouTube Music matches for {youtube_matches}/{total_tracks} tracks")
+                
+                # Display results
+                display_results(combined_df, confidence_threshold, show_thumbnails, include_thumbnails_export, playlist_info)
+            
             else:
                 # Only Spotify data - store in session state
                 st.session_state.search_results = spotify_df
                 display_spotify_only_results(spotify_df, playlist_info)
-                
+        
         except Exception as e:
             st.error(f"❌ Error: {str(e)}")
             
@@ -284,6 +347,10 @@ def display_results(df: pd.DataFrame, confidence_threshold: float, show_thumbnai
             st.dataframe(df[display_columns], use_container_width=True)
         else:
             st.dataframe(df, use_container_width=True)
+        
+        st.caption(f"In-memory size: {memory_report(df)['total_mb']} MB")
+        
+        display_match_picker(df)
     
     # Tab 4: Export
     with selected_tab[3]:
@@ -318,7 +385,7 @@ def display_results(df: pd.DataFrame, confidence_threshold: float, show_thumbnai
                         'confidence_threshold': confidence_threshold
                     }
                     st.rerun()
-        
+            
             # Handle pending playlist creation or show results
             if st.session_state.pending_playlist_creation and st.session_state.playlist_creation_data:
                 # Create YouTube playlist
@@ -405,6 +472,45 @@ def display_results(df: pd.DataFrame, confidence_threshold: float, show_thumbnai
                 mime="text/plain"
             )
 
+def display_match_picker(df: pd.DataFrame):
+    """Let the user replace a track's match with another stored candidate."""
+    
+    store = st.session_state.candidate_store
+    if store is None or st.session_state.spotify_df is None or len(df) == 0:
+        return
+    
+    with st.expander("🔁 Change a match"):
+        position = st.selectbox(
+            "Track",
+            options=range(len(df)),
+            format_func=lambda i: f"{df.iloc[i]['artist_name']} - {df.iloc[i]['track_name']}"
+        )
+        row = df.iloc[position]
+        key = candidate_key(row['artist_name'], row['track_name'], row.get('track_id'))
+        candidates = store.get(key)
+        
+        if len(candidates) == 0:
+            st.info("No YouTube Music candidates were found for this track")
+            return
+        
+        labels = {
+            candidate['youtube_video_id']: f"{candidate['youtube_title']} - {candidate['youtube_artist']} "
+                                           f"({candidate['match_confidence']:.2f})"
+            for candidate in candidates.to_dict('records')
+        }
+        video_id = st.selectbox(
+            "Match",
+            options=list(labels),
+            index=list(labels).index(row['youtube_video_id']) if row['youtube_video_id'] in labels else 0,
+            format_func=labels.get
+        )
+        
+        if st.button("Use this match", disabled=video_id == row['youtube_video_id']):
+            store.select(key, video_id)
+            st.session_state.search_results = store.results(st.session_state.spotify_df)
+            st.rerun()
+
+
 def display_spotify_only_results(df: pd.DataFrame, playlist_info: dict):
     """Display Spotify-only results when YouTube search is disabled."""
     
@@ -464,7 +570,7 @@ def display_export_tab(df: pd.DataFrame, confidence_threshold: float, include_th
                     'confidence_threshold': confidence_threshold
                 }
                 st.rerun()
-    
+        
         # Handle pending playlist creation or show results
         if st.session_state.pending_playlist_creation and st.session_state.playlist_creation_data:
             # Create YouTube playlist
@@ -0,0 +1,58 @@
+"""
+Tests for compact track DataFrames.
+"""
+
+import math
+
+import pandas as pd
+import pytest
+
+from utils.dataframes import ARROW_STRING_DTYPE, records_to_dataframe
+
+
+COLUMNS = ['track_id', 'track_name', 'artist_name', 'album_name', 'spotify_url', 'isrc', 'duration_ms', 'artists']
+
+
+def records(count):
+    return [
+        {
+            'track_id': f'id{index}',
+            'track_name': f'Track {index}',
+            'artist_name': 'Artist',
+            'album_name': f'Album {index}',
+            'spotify_url': f'https://open.spotify.com/track/id{index}',
+            'isrc': None if index == 0 else f'ISRC{index}',
+            'duration_ms': 180000 + index,
+            'artists': ['Artist']
+        }
+        for index in range(count)
+    ]
+
+
+@pytest.fixture(params=[False, True], ids=['object-strings', 'inferred-strings'])
+def infer_string(request):
+    # pandas 2.x defaults to object strings, pandas 3 to inferred Arrow strings
+    with pd.option_context('future.infer_string', request.param):
+        yield
+
+
+@pytest.mark.skipif(ARROW_STRING_DTYPE is None, reason='pyarrow is not installed')
+def test_string_columns_are_arrow_backed(infer_string):
+    df = records_to_dataframe(records(10), COLUMNS)
+    
+    for column in ['track_id', 'track_name', 'album_name', 'spotify_url', 'isrc']:
+        assert df[column].dtype == ARROW_STRING_DTYPE, column
+    assert isinstance(df['artist_name'].dtype, pd.CategoricalDtype)
+    assert df['duration_ms'].dtype == 'int64'
+    assert df['artists'].dtype == object
+    
+    # Missing values stay NaN, as with object columns
+    assert math.isnan(df['isrc'][0])
+    assert df['isrc'].fillna('').tolist()[:2] == ['', 'ISRC1']
+
+
+def test_empty_records_keep_their_columns(infer_string):
+    df = records_to_dataframe([], COLUMNS)
+    
+    assert list(df.columns) == COLUMNS
+    assert df.empty
@@ -0,0 +1,166 @@
+"""
+Tests for incremental playlist sync and YouTube playlist reconciliation.
+"""
+
+import pandas as pd
+import pytest
+
+from services.playlist_sync import PlaylistSyncService, _stable_positions, diff_tracks, track_keys
+from services.scoring import SCORER_VERSION
+
+
+class FakeYouTubeService:
+    """Matches every track to the video ``v<track_id>`` with full confidence."""
+    
+    search_cache = None
+    
+    def search_playlist_tracks(self, spotify_df, top_results=3, max_workers=1):
+        results = spotify_df.copy()
+        results['youtube_video_id'] = 'v' + results['track_id']
+        results['match_confidence'] = 1.0
+        results['scorer_version'] = SCORER_VERSION
+        return results
+
+
+class FakePlaylistService:
+    """In-memory YouTube playlist whose calls can be made to fail per video."""
+    
+    def __init__(self):
+        self.items = []
+        self.next_item = 0
+        self.fail_delete = set()
+        self.fail_move = set()
+        self.fail_insert = set()
+    
+    @property
+    def videos(self):
+        return [video_id for _, video_id in self.items]
+    
+    def create_playlist(self, title, description="", privacy_status="private"):
+        return {'id': 'PL1'}
+    
+    def insert_playlist_item(self, playlist_id, video_id, position=None):
+        if video_id in self.fail_insert:
+            return None
+        self.next_item += 1
+        item_id = f"item{self.next_item}"
+        self.items.insert(len(self.items) if position is None else position, (item_id, video_id))
+        return item_id
+    
+    def move_playlist_item(self, playlist_id, playlist_item_id, video_id, position):
+        if video_id in self.fail_move:
+            return False
+        item = next(item for item in self.items if item[0] == playlist_item_id)
+        self.items.remove(item)
+        self.items.insert(position, item)
+        return True
+    
+    def delete_playlist_item(self, playlist_item_id):
+        item = next(item for item in self.items if item[0] == playlist_item_id)
+        if item[1] in self.fail_delete:
+            return False
+        self.items.remove(item)
+        return True
+
+
+def spotify_frame(track_ids):
+    return pd.DataFrame({
+        'track_id': track_ids,
+        'spotify_url': [f"https://open.spotify.com/track/{track_id}" for track_id in track_ids],
+        'artist_name': [f"Artist {track_id}" for track_id in track_ids],
+        'track_name': [f"Song {track_id}" for track_id in track_ids]
+    })
+
+
+@pytest.fixture
+def playlist():
+    return FakePlaylistService()
+
+
+@pytest.fixture
+def sync(tmp_path, playlist):
+    service = PlaylistSyncService(
+        youtube_service=FakeYouTubeService(),
+        playlist_service=playlist,
+        state_dir=str(tmp_path)
+    )
+    
+    def run(track_ids):
+        result = service.sync('pl', spotify_frame(track_ids))
+        
+        # The stored items must always describe the playlist exactly
+        stored = [(item['item_id'], item['video_id']) for item in service.load_state('pl')['youtube_items']]
+        assert stored == playlist.items
+        return result
+    
+    return run
+
+
+def test_track_keys_number_duplicate_tracks():
+    assert track_keys(spotify_frame(['a', 'b', 'a'])) == ['a#0', 'b#0', 'a#1']
+
+
+def test_stable_positions_finds_longest_increasing_run():
+    assert _stable_positions([]) == set()
+    assert _stable_positions([0, 1, 2]) == {0, 1, 2}
+    assert len(_stable_positions([3, 1, 2, 0])) == 2
+    assert _stable_positions([2, 0, 1]) == {1, 2}
+
+
+def test_diff_tracks():
+    diff = diff_tracks(['a', 'b', 'c', 'd'], ['b', 'a', 'd', 'e'])
+    
+    assert diff['added'] == [3]
+    assert diff['removed'] == [2]
+    assert diff['kept'] == [0, 1, 2]
+    assert len(diff['moved']) == 1
+
+
+@pytest.mark.parametrize('versions', [
+    [['a', 'b', 'c'], ['a', 'c'], ['c', 'a', 'd'], ['d', 'c', 'b', 'a']],
+    [['a', 'b', 'c', 'd', 'e'], ['e', 'd', 'c', 'b', 'a'], ['b', 'e', 'x', 'a']],
+    [['a', 'b', 'a'], ['a', 'a', 'b', 'a'], ['b', 'a']],
+    [[], ['a', 'b'], []],
+])
+def test_sync_keeps_playlist_in_spotify_order(sync, playlist, versions):
+    for track_ids in versions:
+        sync(track_ids)
+        assert playlist.videos == [f"v{track_id}" for track_id in track_ids]
+
+
+def test_failed_delete_is_retried(sync, playlist):
+    sync(['a', 'b', 'c'])
+    
+    playlist.fail_delete.add('vb')
+    result = sync(['a', 'c'])
+    assert result['youtube']['items_failed'] == 1
+    assert playlist.videos == ['va', 'vb', 'vc']
+    
+    playlist.fail_delete.clear()
+    sync(['a', 'c', 'd'])
+    assert playlist.videos == ['va', 'vc', 'vd']
+
+
+def test_failed_move_is_retried(sync, playlist):
+    sync(['a', 'b', 'c'])
+    
+    playlist.fail_move.add('vc')
+    result = sync(['c', 'a', 'b'])
+    assert result['youtube']['items_failed'] == 1
+    assert playlist.videos == ['va', 'vb', 'vc']
+    
+    playlist.fail_move.clear()
+    sync(['c', 'a', 'b'])
+    assert playlist.videos == ['vc', 'va', 'vb']
+
+
+def test_failed_insert_is_retried(sync, playlist):
+    sync(['a', 'b'])
+    
+    playlist.fail_insert.add('vx')
+    sync(['a', 'x', 'b', 'y'])
+    assert playlist.videos == ['va', 'vb', 'vy']
+    
+    playlist.fail_insert.clear()
+    sync(['a', 'x', 'b', 'y'])
+    assert playlist.videos == ['va', 'vx', 'vb', 'vy']
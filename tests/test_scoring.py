@@ -0,0 +1,197 @@
+"""
+Tests for batch confidence scoring and duration parsing.
+"""
+
+import math
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.scoring import duration_scores, parse_durations, score_candidate_frame, score_candidates
+from services.youtube import YouTubeMusicService
+from utils.text import normalize_text
+
+
+WORDS = ['the', 'a', 'love', 'Love', 'LOVE', 'song', 'Beat', 'it', 'x', 'you', 'Beyoncé', 'rémix',
+         '(feat. Someone)', '- 2011 Remaster', '(Live)', '&', "don't", '', '  ']
+TRACK_DURATIONS_MS = [None, 0, float('nan'), 61000, 180000, 215123, 3600000]
+YT_DURATIONS = [None, '', 'x', 61.0, 95, 180, 215, 400, 36000, '3:35', '1:00:00']
+
+
+def random_text(rng):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(0, 4)))
+
+
+def random_cases(count, seed=0):
+    """Candidates that share, partly share or don't share words with their track."""
+    rng = random.Random(seed)
+    cases = []
+    while len(cases) < count:
+        artist, track = random_text(rng), random_text(rng)
+        for _ in range(5):
+            title = rng.choice([track, track.upper(), random_text(rng), f"{track} {random_text(rng)}"])
+            yt_artists = rng.choice([[artist], [artist.upper()], [random_text(rng)],
+                                     [random_text(rng), random_text(rng)], [], [f"{artist} {random_text(rng)}"]])
+            cases.append((artist, track, title, yt_artists,
+                          rng.choice(TRACK_DURATIONS_MS), rng.choice(YT_DURATIONS)))
+    return cases[:count]
+
+
+def reference_duration_seconds(value):
+    """Frozen duration parser for the reference scorer."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if not isinstance(value, str):
+        return float(value)
+    try:
+        seconds = 0.0
+        for part in value.strip().split(':'):
+            seconds = seconds * 60 + float(part)
+        return seconds
+    except ValueError:
+        return None
+
+
+def reference_confidence(artist, track, title, yt_artists, duration_ms=None, yt_duration=None):
+    """
+    Frozen, one-candidate-at-a-time copy of the scoring rules of SCORER_VERSION 3.
+    
+    Deliberately independent of services.scoring: change it only together
+    with a SCORER_VERSION bump.
+    """
+    score = 0.0
+    
+    title = normalize_text(title)
+    yt_artists = [normalize_text(name) for name in yt_artists]
+    artist = normalize_text(artist)
+    track = normalize_text(track)
+    
+    if track in title:
+        score += 0.5
+    elif any(word in title for word in track.split() if len(word) > 2):
+        score += 0.3
+    
+    if any(artist in name or name in artist for name in yt_artists):
+        score += 0.4
+    elif any(word in name for name in yt_artists for word in artist.split() if len(word) > 2):
+        score += 0.2
+    
+    if track == title and artist in yt_artists:
+        score += 0.1
+    
+    yt_seconds = reference_duration_seconds(yt_duration)
+    if duration_ms and duration_ms > 0 and yt_seconds is not None:
+        delta = abs(yt_seconds - duration_ms / 1000)
+        if delta <= 5.0:
+            score += 0.1
+        elif delta > max(30.0, duration_ms / 1000 * 0.25):
+            score -= 0.3
+    
+    return min(max(score, 0.0), 1.0)
+
+
+@pytest.mark.parametrize('case, expected', [
+    (('Queen', 'Bohemian Rhapsody', 'Bohemian Rhapsody', ['Queen']), 1.0),
+    (('Queen', 'Bohemian Rhapsody', 'Bohemian Rhapsody (Live)', ['Queen']), 1.0),
+    (('Beyoncé', 'Halo', 'Halo', ['Beyonce']), 1.0),
+    (('Queen', 'Bohemian Rhapsody', 'Rhapsody in Blue', ['Gershwin']), 0.3),
+    (('Queen', 'Bohemian Rhapsody', 'Bohemian Rhapsody', ['Queen Tribute Band']), 0.9),
+    (('Daft Punk', 'One More Time', 'Around the World', ['Punk Covers']), 0.2),
+    (('Queen', 'Bohemian Rhapsody', 'Bohemian Rhapsody', ['Queen'], 355000, 357), 1.0),
+    (('Queen', 'Bohemian Rhapsody', 'Bohemian Rhapsody', ['Queen'], 355000, '10:00:00'), 0.7),
+    (('Queen', 'Bohemian Rhapsody', 'Rhapsody in Blue', ['Gershwin'], 355000, 357), 0.4),
+    (('Queen', 'Other', 'Nothing', ['Nobody'], 355000, 36000), 0.0),
+])
+def test_scores_of_known_cases(case, expected):
+    assert reference_confidence(*case) == pytest.approx(expected)
+    assert score_candidates(*([value] for value in case))[0] == pytest.approx(expected)
+
+
+def test_batch_scores_match_reference_scores():
+    cases = random_cases(5000)
+    
+    expected = np.array([reference_confidence(*case) for case in cases])
+    artists, tracks, titles, yt_artists, durations_ms, yt_durations = map(list, zip(*cases))
+    scores = score_candidates(artists, tracks, titles, yt_artists, durations_ms, yt_durations)
+    
+    # Exact equality, not approximate: stored scores are compared across versions
+    assert np.array_equal(scores, expected)
+    assert len(np.unique(scores)) > 5
+
+
+def test_score_candidates_without_durations_ignores_them():
+    cases = random_cases(500, seed=1)
+    artists, tracks, titles, yt_artists, durations_ms, yt_durations = map(list, zip(*cases))
+    
+    expected = [reference_confidence(*case[:4]) for case in cases]
+    assert score_candidates(artists, tracks, titles, yt_artists).tolist() == expected
+
+
+def test_single_result_confidence_uses_the_batch_scorer():
+    service = YouTubeMusicService.__new__(YouTubeMusicService)
+    result = {'title': 'Bohemian Rhapsody', 'artists': [{'name': 'Queen'}], 'duration': '10:00:00'}
+    
+    assert service._calculate_match_confidence('Queen', 'Bohemian Rhapsody', result) == 1.0
+    assert service._calculate_match_confidence('Queen', 'Bohemian Rhapsody', result, 355000) == pytest.approx(0.7)
+
+
+def test_score_candidates_rejects_mismatched_columns():
+    assert len(score_candidates([], [], [], [])) == 0
+    with pytest.raises(ValueError):
+        score_candidates(['a'], ['b'], ['c', 'd'], [['a']])
+    with pytest.raises(ValueError):
+        score_candidates(['a'], ['b'], ['c'], [['a']], track_durations_ms=[1000])
+
+
+def test_score_candidate_frame_uses_duration_columns():
+    frame = pd.DataFrame({
+        'artist_name': ['Artist', 'Artist'],
+        'track_name': ['Song', 'Song'],
+        'youtube_title': ['Song', 'Song (10 Hour Loop)'],
+        'youtube_artists': [['Artist'], ['Artist']],
+        'duration_ms': [200000, 200000],
+        'youtube_duration': ['3:20', '10:00:00']
+    }, index=[5, 7])
+    
+    scores = score_candidate_frame(frame)
+    assert scores.index.tolist() == [5, 7]
+    assert scores[5] == 1.0
+    assert scores[7] < 0.7
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('3:45', 225.0),
+    ('0:07', 7.0),
+    (' 4:05 ', 245.0),
+    ('1:02:03', 3723.0),
+    ('10:00:00', 36000.0),
+    (225, 225.0),
+    (4.5, 4.5),
+    ('12', 12.0),
+    ('', math.nan),
+    ('live', math.nan),
+    ('3:x', math.nan),
+    (None, math.nan),
+    (float('nan'), math.nan),
+])
+def test_parse_durations(value, expected):
+    (seconds,) = parse_durations([value])
+    if math.isnan(expected):
+        assert math.isnan(seconds)
+    else:
+        assert seconds == expected
+
+
+def test_parse_durations_handles_mixed_and_empty_input():
+    assert len(parse_durations([])) == 0
+    np.testing.assert_array_equal(parse_durations(['1:00', 30, '1:00:00', None]), [60.0, 30.0, 3600.0, np.nan])
+
+
+def test_duration_scores():
+    scores = duration_scores(
+        [200000, 200000, 200000, 200000, None, 0],
+        [203, 220, 300, '3:20', 200, 200]
+    )
+    assert scores.tolist() == [0.1, 0.0, -0.3, 0.1, 0.0, 0.0]
@@ -0,0 +1,114 @@
+"""
+Tests for Spotify request scheduling against a local stub server.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import spotipy
+from spotipy.exceptions import SpotifyException
+
+from services.spotify import RateLimitedSpotify, build_spotify_session
+from utils.rate_limit import TokenBucket
+
+
+class StubServer(ThreadingHTTPServer):
+    """Answers requests with a scripted list of statuses, then 200s."""
+    
+    def __init__(self, statuses):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.statuses = list(statuses)
+        self.requests = 0
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests += 1
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        
+        body = json.dumps({'id': 'abc'} if status == 200 else {'error': {'status': status, 'message': 'stub'}})
+        self.send_response(status)
+        if status == 429:
+            self.send_header('Retry-After', '1')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode())
+    
+    def log_message(self, *args):
+        pass
+
+
+class RecordingBucket(TokenBucket):
+    """Token bucket that records pauses instead of sleeping through them."""
+    
+    def __init__(self, server):
+        super().__init__(rate=1000.0)
+        self.server = server
+        self.pauses = []
+    
+    def pause(self, seconds):
+        self.pauses.append((self.server.requests, seconds))
+
+
+@pytest.fixture
+def stub():
+    servers = []
+    
+    def start(statuses):
+        server = StubServer(statuses)
+        threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+        servers.append(server)
+        
+        client = spotipy.Spotify(auth='token', requests_session=build_spotify_session())
+        client.prefix = f"http://127.0.0.1:{server.server_port}/v1/"
+        bucket = RecordingBucket(server)
+        return server, bucket, RateLimitedSpotify(client, bucket, max_retries=3, backoff_base=0.01)
+    
+    yield start
+    
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_each_429_pauses_the_shared_bucket_after_one_request(stub):
+    server, bucket, client = stub([429, 429])
+    
+    assert client.track('abc') == {'id': 'abc'}
+    assert server.requests == 3
+    
+    # One upstream request per 429, and the pause uses the server's Retry-After
+    assert [requests for requests, _ in bucket.pauses] == [1, 2]
+    assert all(1 <= seconds <= 2 for _, seconds in bucket.pauses)
+
+
+def test_429_gives_up_after_max_retries(stub):
+    server, bucket, client = stub([429] * 10)
+    
+    with pytest.raises(SpotifyException) as error:
+        client.track('abc')
+    
+    assert error.value.http_status == 429
+    assert server.requests == 4
+    assert len(bucket.pauses) == 3
+
+
+def test_server_errors_are_retried_without_pausing_other_threads(stub):
+    server, bucket, client = stub([503, 500])
+    
+    assert client.track('abc') == {'id': 'abc'}
+    assert server.requests == 3
+    assert bucket.pauses == []
+
+
+def test_client_errors_are_not_retried(stub):
+    server, bucket, client = stub([404])
+    
+    with pytest.raises(SpotifyException) as error:
+        client.track('abc')
+    
+    assert error.value.http_status == 404
+    assert server.requests == 1
@@ -0,0 +1,75 @@
+"""
+Tests for streaming playlist tracks page by page.
+"""
+
+import gc
+
+import pytest
+
+import services.spotify as spotify_module
+from services.spotify import SpotifyService
+
+
+PAGES = 3
+PAGE_TRACKS = 4
+
+
+def page(number):
+    items = []
+    for index in range(PAGE_TRACKS):
+        track_id = f'{number}-{index}'
+        items.append({'track': {
+            'id': track_id,
+            'name': f'Track {track_id}',
+            'artists': [{'name': 'Artist'}],
+            'album': {'name': 'Album'},
+            'external_urls': {'spotify': f'https://open.spotify.com/track/{track_id}'},
+            'duration_ms': 180000
+        }})
+    return {'items': items}
+
+
+class FakeCache:
+    def __init__(self):
+        self.stored = {}
+    
+    def get(self, playlist_id, snapshot_id):
+        return None
+    
+    def put(self, playlist_id, snapshot_id, tracks):
+        self.stored[(playlist_id, snapshot_id)] = list(tracks)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    cache = FakeCache()
+    monkeypatch.setattr(spotify_module, 'get_playlist_cache', lambda: cache)
+    
+    service = SpotifyService.__new__(SpotifyService)
+    service._iter_pages = lambda playlist_id, concurrent=False, max_workers=8: (page(n) for n in range(PAGES))
+    service.get_playlist_snapshot_id = lambda playlist_url: 'snapshot'
+    service.cache = cache
+    return service
+
+
+def held_by_a_list(track):
+    gc.collect()
+    return any(isinstance(referrer, list) for referrer in gc.get_referrers(track))
+
+
+@pytest.mark.parametrize('use_cache', [False, True])
+def test_earlier_pages_are_only_kept_when_caching(service, use_cache):
+    tracks = service.iter_playlist_tracks('spotify:playlist:abc123', use_cache=use_cache)
+    first = next(tracks)
+    
+    # Move on to the second page; the first page's list is no longer needed
+    for _ in range(PAGE_TRACKS):
+        next(tracks)
+    
+    assert held_by_a_list(first) is use_cache
+    
+    rest = list(tracks)
+    assert len(rest) == (PAGES - 1) * PAGE_TRACKS - 1
+    assert bool(service.cache.stored) is use_cache
+    if use_cache:
+        assert len(service.cache.stored['abc123', 'snapshot']) == PAGES * PAGE_TRACKS
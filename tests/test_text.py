@@ -0,0 +1,51 @@
+"""
+Tests for title and artist normalization.
+"""
+
+import pandas as pd
+import pytest
+
+from services.batch import search_keys
+from utils.search_cache import search_cache_key
+from utils.text import normalize_key, normalize_text, strip_credit_tags, strip_version_tags
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Song (feat. X)', 'Song'),
+    ('Song feat. X', 'Song'),
+    ('Song - 2011 Remaster', 'Song'),
+    ('Song [Remastered 2009]', 'Song'),
+    ('Song (Live)', 'Song'),
+    ('Song - Live', 'Song'),
+    ('Song [Live at Wembley]', 'Song'),
+    ('Hotel California - Live On MTV, 1994', 'Hotel California'),
+    ('Love (Live Life)', 'Love (Live Life)'),
+    ('Song - Live Forever', 'Song - Live Forever'),
+    ('Live Forever', 'Live Forever'),
+    ('(Live)', '(Live)'),
+])
+def test_strip_version_tags(text, expected):
+    assert strip_version_tags(text) == expected
+
+
+def test_strip_credit_tags_keeps_live_tags():
+    assert strip_credit_tags('Song (Live) [2011 Remaster]') == 'Song (Live)'
+    assert strip_credit_tags('Hotel California - Live On MTV, 1994') == 'Hotel California - Live On MTV, 1994'
+
+
+def test_normalize_text_folds_accents_and_punctuation():
+    assert normalize_text('Beyoncé & Jay-Z') == 'beyonce and jay z'
+    assert normalize_text("Don't Stop - 2011 Remaster") == 'dont stop'
+    assert normalize_text('!!!') == '!!!'
+
+
+def test_live_recordings_keep_their_own_keys():
+    live, studio = 'Hotel California - Live On MTV, 1994', 'Hotel California'
+    
+    assert normalize_text(live) == normalize_text(studio)
+    assert normalize_key(live) != normalize_key(studio)
+    assert search_cache_key('Eagles', live, 'songs', 5) != search_cache_key('Eagles', studio, 'songs', 5)
+    
+    keys = search_keys(pd.DataFrame({'artist_name': ['Eagles'] * 3, 'track_name': [live, studio, studio + ' (feat. X)']}))
+    assert keys[0] != keys[1]
+    assert keys[1] == keys[2]
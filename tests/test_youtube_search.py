@@ -0,0 +1,88 @@
+"""
+Tests for concurrent YouTube Music searches with a fake client.
+"""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from services.youtube import YouTubeMusicService
+
+
+class FakeYTMusic:
+    """Returns one exact match per query; counts how many clients exist."""
+    
+    created = 0
+    lock = threading.Lock()
+    
+    def __init__(self):
+        with FakeYTMusic.lock:
+            FakeYTMusic.created += 1
+        self.in_use = threading.Lock()
+    
+    def search(self, query, filter=None, limit=20):
+        # Two searches sharing a client would trip this
+        assert self.in_use.acquire(blocking=False), "client used by two searches at once"
+        try:
+            time.sleep(0.001)
+            artist, _, title = query.rpartition(' ')
+            return [{
+                'title': title,
+                'artists': [{'name': artist}],
+                'album': {'name': 'Album'},
+                'duration': '3:20',
+                'duration_seconds': 200,
+                'videoId': f"v{title}",
+                'thumbnails': []
+            }]
+        finally:
+            self.in_use.release()
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(FakeYTMusic, 'created', 0)
+    monkeypatch.setattr(YouTubeMusicService, '_create_client', staticmethod(FakeYTMusic))
+    return YouTubeMusicService(use_cache=False)
+
+
+def spotify_frame(count, start=0):
+    return pd.DataFrame({
+        'track_id': [f"id{i}" for i in range(start, start + count)],
+        'track_name': [f"Song{i}" for i in range(start, start + count)],
+        'artist_name': [f"Artist{i}" for i in range(start, start + count)],
+        'album_name': ['Album'] * count,
+        'spotify_url': [f"https://open.spotify.com/track/id{i}" for i in range(start, start + count)],
+        'duration_ms': [200000] * count
+    }, index=range(start + 10, start + count + 10))
+
+
+def test_chunked_search_reuses_clients_and_keeps_order(service):
+    chunks = [spotify_frame(20, start) for start in range(0, 200, 20)]
+    progress = []
+    
+    for _ in range(2):
+        results = list(service.iter_search_playlist_tracks(
+            iter(chunks), top_results=1, max_workers=8, progress_callback=lambda *args: progress.append(args)
+        ))
+    
+    # One client per concurrent search, created once for all chunks and calls
+    assert FakeYTMusic.created <= 8
+    
+    assert [list(result.index) for result in results] == [list(chunk.index) for chunk in chunks]
+    combined = pd.concat(results)
+    assert combined['youtube_video_id'].tolist() == [f"vSong{i}" for i in range(200)]
+    assert (combined['match_confidence'] == 1.0).all()
+    assert progress[-1] == (200, 200)
+
+
+def test_parallel_search_matches_sequential_search(service):
+    spotify_df = spotify_frame(30)
+    
+    parallel = service.search_playlist_tracks(spotify_df, top_results=1, max_workers=4)
+    sequential = service.search_playlist_tracks(spotify_df, top_results=1, max_workers=1)
+    
+    pd.testing.assert_frame_equal(parallel, sequential)
+    assert len(service.search_playlist_tracks(spotify_df.iloc[:0], max_workers=4)) == 0
@@ -0,0 +1,117 @@
+"""
+DataFrame utilities for keeping track tables compact in memory.
+"""
+
+import importlib.util
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+import pandas as pd
+
+
+# String columns whose values repeat heavily within a playlist
+CATEGORICAL_COLUMNS = ('artist_name', 'album_name', 'youtube_artist', 'youtube_album')
+
+# Arrow-backed strings with NaN for missing values, pandas 3's default string
+# dtype; None when pyarrow is not installed
+ARROW_STRING_DTYPE = (
+    pd.StringDtype('pyarrow', na_value=np.nan) if importlib.util.find_spec('pyarrow') else None
+)
+
+
+def compact_dataframe(df: pd.DataFrame, columns: Iterable[str] = CATEGORICAL_COLUMNS) -> pd.DataFrame:
+    """
+    Store repetitive string columns as categoricals.
+    
+    A column is only converted when at most half of its values are distinct,
+    which is where a categorical is smaller than one string per row.
+    
+    Args:
+        df: DataFrame to compact (modified in place)
+        columns: Candidate columns to convert
+        
+    Returns:
+        The same DataFrame, for chaining
+    """
+    for column in columns:
+        if column not in df or isinstance(df[column].dtype, pd.CategoricalDtype):
+            continue
+        
+        if df[column].nunique(dropna=False) <= len(df) / 2:
+            df[column] = df[column].astype('category')
+    
+    return df
+
+
+def arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store the remaining plain string columns as Arrow-backed strings.
+    
+    pandas before 3.0 keeps strings as one Python object per value unless
+    ``future.infer_string`` is enabled; Arrow stores them in one contiguous
+    buffer. Columns holding anything but strings and missing values are left
+    alone, and nothing changes when pyarrow is not installed.
+    
+    Args:
+        df: DataFrame to convert (modified in place)
+        
+    Returns:
+        The same DataFrame, for chaining
+    """
+    if ARROW_STRING_DTYPE is None:
+        return df
+    
+    for column in df.columns:
+        if df[column].dtype == object and pd.api.types.infer_dtype(df[column], skipna=True) == 'string':
+            df[column] = df[column].astype(ARROW_STRING_DTYPE)
+    
+    return df
+
+
+def records_to_dataframe(records: Iterable[Dict], columns: List[str], index: Optional[Iterable] = None) -> pd.DataFrame:
+    """
+    Build a compact DataFrame column by column from records.
+    
+    Values are appended straight into per-column lists, so no intermediate
+    list of per-row dictionaries is held for the whole table. Repetitive
+    columns become categoricals and other string columns Arrow strings.
+    
+    Args:
+        records: Iterable of dictionaries (missing keys become None)
+        columns: Column names, in output order
+        index: Optional index for the DataFrame
+        
+    Returns:
+        Compacted DataFrame with the given columns
+    """
+    data = {column: [] for column in columns}
+    
+    for record in records:
+        for column in columns:
+            data[column].append(record.get(column))
+    
+    return arrow_strings(compact_dataframe(pd.DataFrame(data, index=index)))
+
+
+def memory_report(df: pd.DataFrame) -> Dict:
+    """
+    Report how much memory a DataFrame uses.
+    
+    Args:
+        df: DataFrame to measure
+        
+    Returns:
+        Dictionary with row count, total size in MB and per-column dtype and size
+    """
+    usage = df.memory_usage(deep=True, index=True)
+    
+    return {
+        'rows': len(df),
+        'total_mb': round(usage.sum() / (1024 * 1024), 2),
+        'columns': {
+            column: {
+                'dtype': str(df[column].dtype),
+                'mb': round(usage[column] / (1024 * 1024), 3)
+            }
+            for column in df.columns
+        }
+    }
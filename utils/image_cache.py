@@ -4,11 +4,14 @@ Image cache utility for downloading and storing YouTube thumbnails locally.
 
 import os
 import hashlib
+import tempfile
 import requests
 from pathlib import Path
 from typing import Optional
 import time
 
+from utils.single_flight import SingleFlight
+
 
 class ImageCache:
     """Utility class for caching images locally."""
@@ -28,6 +31,9 @@ class ImageCache:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        
+        # Concurrent requests for the same URL share one download
+        self._downloads = SingleFlight()
     
     def _get_cache_filename(self, url: str, extension: str = "jpg") -> str:
         """
@@ -72,10 +78,31 @@ class ImageCache:
         else:
             return 'jpg'  # Default for YouTube thumbnails
     
+    def _find_cached_image(self, url: str) -> Optional[str]:
+        """
+        Find an already cached image.
+        
+        Args:
+            url: Image URL
+            
+        Returns:
+            Local file path if cached, None otherwise
+        """
+        # Check if already cached (try different extensions)
+        for ext in ['jpg', 'png', 'webp']:
+            filename = self._get_cache_filename(url, ext)
+            cache_path = self.cache_dir / filename
+            if cache_path.exists():
+                return str(cache_path)
+        
+        return None
+    
     def get_cached_image(self, url: str) -> Optional[str]:
         """
         Get cached image path, downloading if necessary.
         
+        Concurrent calls for the same URL wait for a single download.
+        
         Args:
             url: Image URL to cache
             
@@ -85,13 +112,27 @@ class ImageCache:
         if not url:
             return None
         
+        cached_path = self._find_cached_image(url)
+        if cached_path:
+            return cached_path
+        
+        return self._downloads.do(url, self._download_image, url)
+    
+    def _download_image(self, url: str) -> Optional[str]:
+        """
+        Download an image into the cache.
+        
+        Args:
+            url: Image URL to cache
+            
+        Returns:
+            Local file path if successful, None if failed
+        """
         try:
-            # Check if already cached (try different extensions)
-            for ext in ['jpg', 'png', 'webp']:
-                filename = self._get_cache_filename(url, ext)
-                cache_path = self.cache_dir / filename
-                if cache_path.exists():
-                    return str(cache_path)
+            # Another download of this URL may have finished since the caller checked
+            cached_path = self._find_cached_image(url)
+            if cached_path:
+                return cached_path
             
             # Download the image
             print(f"Downloading thumbnail: {url}")
@@ -106,13 +147,24 @@ class ImageCache:
             filename = self._get_cache_filename(url, extension)
             cache_path = self.cache_dir / filename
             
-            with open(cache_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Write to a uniquely named temporary file first, so callers never pick up a
+            # partial image and concurrent downloads from other processes can't interleave
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{filename}.", suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
             
             print(f"Cached thumbnail: {cache_path}")
             return str(cache_path)
-            
+        
         except Exception as e:
             print(f"Failed to cache image {url}: {e}")
             return None
@@ -0,0 +1,141 @@
+"""
+File I/O utilities for reading and writing local data files.
+"""
+
+import csv
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+
+# Column / key names recognized as the playlist link in CSV and JSONL manifests
+MANIFEST_FIELDS = ('url', 'uri', 'playlist_url', 'playlist_uri', 'playlist', 'link')
+
+
+def read_json(path: Union[str, Path]) -> Optional[Any]:
+    """
+    Read a JSON file.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Parsed JSON data, or None if the file is missing or unreadable
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Failed to read {path}: {e}")
+        return None
+
+
+def write_json(path: Union[str, Path], data: Any):
+    """
+    Write data to a JSON file atomically.
+    
+    The data is written to a temporary file in the same directory and then
+    moved into place, so concurrent readers never see a partial file.
+    
+    Args:
+        path: Destination path
+        data: JSON-serializable data
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _manifest_value(record: dict) -> Optional[str]:
+    """Pick the playlist link out of a CSV row or JSON object."""
+    lowered = {str(key).strip().lower(): value for key, value in record.items()}
+    
+    for field in MANIFEST_FIELDS:
+        if lowered.get(field):
+            return str(lowered[field])
+    
+    return None
+
+
+def read_manifest(path: Union[str, Path]) -> Iterator[str]:
+    """
+    Read playlist links from a manifest file.
+    
+    Supported formats, chosen by file extension:
+    - ``.csv``: a ``url``/``uri``/``playlist_url``/... column, or the first column
+    - ``.jsonl``: one JSON string or object with a ``url``/``uri``/... key per line
+    - anything else: one link per line; blank lines and ``#`` comments are skipped
+    
+    Args:
+        path: Path to the manifest file
+        
+    Yields:
+        Playlist links as they appear in the manifest
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if suffix == '.csv':
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            
+            columns = [column.strip().lower() for column in header]
+            field = next((name for name in MANIFEST_FIELDS if name in columns), None)
+            
+            if field is None:
+                # No recognized header: treat the first row as data, links in the first column
+                column_index = 0
+                if header and header[0].strip():
+                    yield header[0].strip()
+            else:
+                column_index = columns.index(field)
+            
+            for row in reader:
+                if len(row) > column_index and row[column_index].strip():
+                    yield row[column_index].strip()
+        
+        elif suffix == '.jsonl':
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    print(f"Skipping invalid JSON on line {line_number} of {path}")
+                    continue
+                
+                if isinstance(record, str):
+                    value = record
+                elif isinstance(record, dict):
+                    value = _manifest_value(record)
+                else:
+                    value = None
+
+                if value:
+                    yield value.strip()
+        
+        else:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    yield line
@@ -0,0 +1,109 @@
+"""
+Playlist cache utility for storing Spotify playlist tracks locally.
+
+Entries are keyed by playlist ID and Spotify's ``snapshot_id``, which changes
+whenever the playlist is modified, so a cached copy is valid for exactly as
+long as its snapshot is current.
+"""
+
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.io import read_json, write_json
+
+
+# Bump when the stored track schema changes so older entries are refetched
+CACHE_VERSION = 2
+
+
+class PlaylistCache:
+    """Utility class for caching playlist tracks on disk."""
+    
+    def __init__(self, cache_dir: str = "data/playlists"):
+        """
+        Initialize playlist cache.
+        
+        Args:
+            cache_dir: Directory to store cached playlists
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _get_cache_path(self, playlist_id: str) -> Path:
+        """
+        Get the cache file path for a playlist.
+        
+        Args:
+            playlist_id: Spotify playlist ID
+            
+        Returns:
+            Path of the cache file
+        """
+        return self.cache_dir / f"{playlist_id}.json"
+    
+    def get(self, playlist_id: str, snapshot_id: str) -> Optional[List[Dict]]:
+        """
+        Get cached tracks for a playlist snapshot.
+        
+        Args:
+            playlist_id: Spotify playlist ID
+            snapshot_id: Current Spotify snapshot ID of the playlist
+            
+        Returns:
+            List of track dictionaries, or None if not cached or stale
+        """
+        entry = read_json(self._get_cache_path(playlist_id))
+        
+        if not entry or entry.get('version') != CACHE_VERSION or entry.get('snapshot_id') != snapshot_id:
+            return None
+        
+        return entry['tracks']
+    
+    def put(self, playlist_id: str, snapshot_id: str, tracks: List[Dict]):
+        """
+        Store tracks for a playlist snapshot, replacing any older snapshot.
+        
+        Args:
+            playlist_id: Spotify playlist ID
+            snapshot_id: Spotify snapshot ID the tracks belong to
+            tracks: List of track dictionaries
+        """
+        write_json(self._get_cache_path(playlist_id), {
+            'version': CACHE_VERSION,
+            'playlist_id': playlist_id,
+            'snapshot_id': snapshot_id,
+            'cached_at': time.time(),
+            'tracks': tracks
+        })
+    
+    def clear_cache(self, max_age_days: int = 30):
+        """
+        Clear old cached playlists.
+        
+        Args:
+            max_age_days: Remove playlists cached longer ago than this many days
+        """
+        cutoff_time = time.time() - (max_age_days * 24 * 60 * 60)
+        removed_count = 0
+        
+        for file_path in self.cache_dir.glob('*.json'):
+            if file_path.stat().st_mtime < cutoff_time:
+                try:
+                    file_path.unlink()
+                    removed_count += 1
+                except Exception as e:
+                    print(f"Failed to remove {file_path}: {e}")
+        
+        print(f"Removed {removed_count} old cached playlists")
+
+
+# Global cache instance
+_playlist_cache = None
+
+def get_playlist_cache() -> PlaylistCache:
+    """Get the global playlist cache instance."""
+    global _playlist_cache
+    if _playlist_cache is None:
+        _playlist_cache = PlaylistCache()
+    return _playlist_cache
@@ -0,0 +1,72 @@
+"""
+Rate limiting utilities for outgoing API requests.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket for pacing requests across threads."""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize token bucket.
+        
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum number of tokens (burst size), defaults to rate
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1.0):
+        """
+        Block until the requested number of tokens is available, then take them.
+        
+        Args:
+            tokens: Number of tokens to take
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return
+                    
+                    wait = (tokens - self._tokens) / self.rate
+            
+            # Sleep outside the lock so other threads can check in
+            time.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """
+        Stop handing out tokens to every thread for a while.
+        
+        Used when the server asks clients to back off. The bucket restarts
+        empty afterwards so requests resume at the sustained rate instead of
+        bursting.
+        
+        Args:
+            seconds: How long to pause
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._updated = self._paused_until
@@ -0,0 +1,213 @@
+"""
+Search cache utility for storing YouTube Music search results in SQLite.
+
+Entries are keyed by the normalized artist, track name, search filter and
+result limit, and expire after a configurable time to live. The database runs
+in WAL mode so several processes can read and write it at the same time.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.text import normalize_key
+
+
+# Default time to live for cached searches
+DEFAULT_TTL_DAYS = 7.0
+
+
+def search_cache_key(artist: str, track_name: str, search_filter: str, limit: int) -> str:
+    """
+    Build the cache key for a search.
+    
+    Artist and track name are normalized with ``normalize_key``, so the
+    same track spelled with different case, accents, credits or remaster
+    tags shares one entry.
+    
+    Args:
+        artist: Artist name
+        track_name: Track name
+        search_filter: YouTube Music search filter (e.g. ``songs``)
+        limit: Maximum number of results requested
+        
+    Returns:
+        Cache key
+    """
+    return '\x1f'.join([normalize_key(str(artist)), normalize_key(str(track_name)), search_filter, str(limit)])
+
+
+class SearchCache:
+    """Utility class for caching YouTube Music search results on disk."""
+    
+    def __init__(self, db_path: str = "data/search_cache.db", ttl_days: float = DEFAULT_TTL_DAYS):
+        """
+        Initialize search cache.
+        
+        Args:
+            db_path: SQLite database file
+            ttl_days: Days after which a cached search is searched again
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        
+        # sqlite3 connections can't be shared between threads, so each thread opens its own
+        self._local = threading.local()
+        
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS searches ("
+                "key TEXT PRIMARY KEY, "
+                "results TEXT NOT NULL, "
+                "created_at REAL NOT NULL)"
+            )
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get the database connection for the current thread.
+        
+        Returns:
+            SQLite connection
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def _count(self, hit: bool):
+        """Record a cache hit or miss."""
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+    
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """
+        Get cached search results.
+        
+        Args:
+            key: Key from ``search_cache_key``
+            
+        Returns:
+            List of processed search results, or None if not cached or expired
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT results, created_at FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Failed to read search cache: {e}")
+            row = None
+        
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            self._count(False)
+            return None
+        
+        self._count(True)
+        return json.loads(row[0])
+    
+    def get_track_entries(self, artist: str, track_name: str) -> List[List[Dict]]:
+        """
+        Get every cached search for an artist and track, whatever its filter,
+        limit or age.
+        
+        Meant for offline work such as re-scoring, where an expired entry is
+        still better than nothing. Lookups here don't count as hits or misses.
+        
+        Args:
+            artist: Artist name
+            track_name: Track name
+            
+        Returns:
+            List of cached result lists
+        """
+        prefix = '\x1f'.join([normalize_key(str(artist)), normalize_key(str(track_name))])
+        
+        # Keys continue with '\x1f' after the prefix; '\x20' is the next character up
+        rows = self._connect().execute(
+            "SELECT results FROM searches WHERE key >= ? AND key < ?",
+            (prefix + '\x1f', prefix + '\x20')
+        ).fetchall()
+        
+        return [json.loads(row[0]) for row in rows]
+    
+    def put(self, key: str, results: List[Dict]):
+        """
+        Store search results, replacing any older entry.
+        
+        Args:
+            key: Key from ``search_cache_key``
+            results: List of processed search results
+        """
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO searches (key, results, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(results, ensure_ascii=False), time.time())
+                )
+        except sqlite3.Error as e:
+            print(f"Failed to write search cache: {e}")
+    
+    def clear_cache(self, max_age_days: Optional[float] = None):
+        """
+        Remove old cached searches.
+        
+        Args:
+            max_age_days: Remove searches older than this many days
+                (defaults to the cache's time to live)
+        """
+        max_age_seconds = self.ttl_seconds if max_age_days is None else max_age_days * 24 * 60 * 60
+        
+        with self._connect() as conn:
+            removed_count = conn.execute(
+                "DELETE FROM searches WHERE created_at < ?", (time.time() - max_age_seconds,)
+            ).rowcount
+        
+        print(f"Removed {removed_count} old cached searches")
+    
+    def get_cache_info(self) -> dict:
+        """
+        Get information about the cache.
+        
+        Returns:
+            Dictionary with cache statistics
+        """
+        total_entries = self._connect().execute("SELECT COUNT(*) FROM searches").fetchone()[0]
+        lookups = self.hits + self.misses
+        
+        return {
+            'total_entries': total_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'db_path': str(self.db_path)
+        }
+
+
+# Global cache instance
+_search_cache = None
+_search_cache_lock = threading.Lock()
+
+def get_search_cache() -> SearchCache:
+    """Get the global search cache instance."""
+    global _search_cache
+    with _search_cache_lock:
+        if _search_cache is None:
+            _search_cache = SearchCache(
+                db_path=os.getenv('YTMUSIC_SEARCH_CACHE', "data/search_cache.db"),
+                ttl_days=float(os.getenv('YTMUSIC_SEARCH_CACHE_TTL_DAYS', DEFAULT_TTL_DAYS))
+            )
+        return _search_cache
@@ -0,0 +1,61 @@
+"""
+Single-flight utility for coalescing identical concurrent calls.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its outcome with every waiting caller."""
+    
+    def __init__(self):
+        """Initialize single-flight group."""
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.shared = 0
+    
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call ``fn`` unless a call for the same key is already in flight.
+        
+        The first caller for a key runs ``fn``; callers arriving while it runs
+        wait for it and receive the same return value, or the same exception.
+        Once the call finishes, the next caller for the key starts a new one.
+        
+        Args:
+            key: Identifies calls that may be shared
+            fn: Function to call
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+            
+        Returns:
+            Return value of ``fn``
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.shared += 1
+                leader = False
+            else:
+                future = Future()
+                self._calls[key] = future
+                self.calls += 1
+                leader = True
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -0,0 +1,127 @@
+"""
+Text normalization utilities for matching track titles and artist names.
+
+Spotify and YouTube Music spell the same recording differently: accents
+("Beyoncé" / "Beyonce"), featured-artist credits, remaster and live
+suffixes, and punctuation. Both sides are normalized with these functions
+before they are compared or used as cache keys. Live tags are only dropped
+when titles are compared: queries and keys keep them, so a live recording is
+never searched for or cached as its studio version. Results are memoized
+because the same titles and artists recur across playlists.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+
+# Number of distinct strings remembered by each normalization function
+NORMALIZE_CACHE_SIZE = 65536
+
+# Words that mark a credit or remaster tag rather than part of the title
+_TAG_WORDS = r'(?:feat\.?|ft\.?|featuring|remaster(?:ed)?)(?![a-z0-9])'
+
+# "(feat. X)", "[2011 Remaster]", "(Remastered 2009)"
+_BRACKETED_TAG_PATTERN = re.compile(r'\s*[(\[][^)\]]*\b' + _TAG_WORDS + r'[^)\]]*[)\]]', re.IGNORECASE)
+
+# "- 2011 Remaster", "- Remastered 2009"
+_DASH_TAG_PATTERN = re.compile(r'\s+[-–—]\s+[^-–—]*\b' + _TAG_WORDS + r'.*$', re.IGNORECASE)
+
+# A live tag is "Live" alone or followed by a venue, date or year, never other title words
+_LIVE_TAG = r'(?:\d{{4}}\s+)?live(?:\s+(?:at|from|in|on|version|recording|session)\b{rest}|\s*,{rest}|\s+\d{{4}})?'
+
+# "(Live)", "[Live at Wembley]", "(Live On MTV, 1994)" but not "(Live Life)"
+_BRACKETED_LIVE_PATTERN = re.compile(
+    r'\s*[(\[]\s*' + _LIVE_TAG.format(rest=r'[^)\]]*') + r'\s*[)\]]', re.IGNORECASE
+)
+
+# "- Live", "- Live On MTV, 1994" but not "- Live Forever"
+_DASH_LIVE_PATTERN = re.compile(r'\s+[-–—]\s+' + _LIVE_TAG.format(rest='.*') + r'\s*$', re.IGNORECASE)
+
+# "Song feat. X" with no brackets
+_FEATURING_PATTERN = re.compile(r'\s+(?:feat\.?|ft\.|featuring)\s+.*$', re.IGNORECASE)
+
+# Apostrophes are dropped ("don't" -> "dont"); other punctuation separates words
+_APOSTROPHE_PATTERN = re.compile(r"['‘’`]")
+_NON_WORD_PATTERN = re.compile(r'[\W_]+')
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def strip_credit_tags(text: str) -> str:
+    """
+    Remove featured-artist and remaster tags from a title or artist.
+    
+    Case and punctuation are left alone, so the result still reads well as a
+    search query.
+    
+    Args:
+        text: Track title or artist name
+        
+    Returns:
+        Text without credit tags (the original text if nothing would remain)
+    """
+    stripped = _BRACKETED_TAG_PATTERN.sub('', text)
+    stripped = _DASH_TAG_PATTERN.sub('', stripped)
+    stripped = _FEATURING_PATTERN.sub('', stripped).strip()
+    return stripped or text.strip()
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def strip_version_tags(text: str) -> str:
+    """
+    Remove featured-artist, remaster and live tags from a title or artist.
+    
+    Args:
+        text: Track title or artist name
+        
+    Returns:
+        Text without version tags (the original text if nothing would remain)
+    """
+    stripped = _BRACKETED_LIVE_PATTERN.sub('', strip_credit_tags(text))
+    stripped = _DASH_LIVE_PATTERN.sub('', stripped).strip()
+    return stripped or text.strip()
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_text(text: str) -> str:
+    """
+    Normalize a title or artist name for comparison.
+    
+    Applies Unicode casefolding, accent stripping, version-tag removal and
+    punctuation folding, then collapses whitespace.
+    
+    Args:
+        text: Track title or artist name
+        
+    Returns:
+        Normalized text (casefolded text if normalization would leave nothing,
+        e.g. for an artist named "!!!")
+    """
+    return _fold_text(strip_version_tags(text), text)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_key(text: str) -> str:
+    """
+    Normalize a title or artist name for cache and de-duplication keys.
+    
+    Same as ``normalize_text`` except that live tags are kept, so a live
+    recording never shares a key with its studio version.
+    
+    Args:
+        text: Track title or artist name
+        
+    Returns:
+        Normalized text
+    """
+    return _fold_text(strip_credit_tags(text), text)
+
+
+def _fold_text(stripped: str, text: str) -> str:
+    """Fold case, accents and punctuation of tag-stripped text, falling back to the raw text."""
+    folded = unicodedata.normalize('NFKD', stripped)
+    folded = ''.join(char for char in folded if not unicodedata.combining(char)).casefold()
+    folded = folded.replace('&', ' and ')
+    folded = _APOSTROPHE_PATTERN.sub('', folded)
+    folded = ' '.join(_NON_WORD_PATTERN.sub(' ', folded).split())
+    return folded or ' '.join(text.casefold().split())